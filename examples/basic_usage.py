@@ -6,9 +6,8 @@ Demonstrates how to use the monitoring and safety system for LLM applications.
 
 import asyncio
 import os
-from datetime import datetime
 
-from llm_guardian import GuardianConfig, LLMGuardian, RequestContext
+from llm_guardian import GuardianConfig, LLMGuardian, RequestContext, install_uvloop
 
 
 async def main():
@@ -37,7 +36,7 @@ async def main():
     # 2. Create request context with explicit constraints
     print("2. Creating request context...")
     context = RequestContext(
-        request_id=f"example-{datetime.now().strftime('%Y%m%d-%H%M%S')}",
+        request_id=guardian.new_request_id(),
         user_id="demo-user",
         session_id="demo-session",
         prompt="Explain quantum computing in simple terms",
@@ -148,5 +147,8 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Use uvloop when installed for lower event-loop overhead
+    install_uvloop()
+
     # Run the example
     asyncio.run(main())
@@ -0,0 +1,169 @@
+"""
+Micro-batching of concurrent LLM requests.
+
+Coalesces in-flight requests that target the same (provider, model, temperature)
+into a single provider batch call, amortizing connection and safety-mechanism
+overhead across many prompts.
+"""
+
+import asyncio
+from typing import Callable, Dict, List, Tuple
+
+from llm_guardian.core.models import LLMResponse, RequestContext
+from llm_guardian.integrations.base import BaseLLMClient
+from llm_guardian.utils.queues import collect_batch
+
+# Key identifying requests that can share a batch
+BatchKey = Tuple[str, str, float]
+
+
+class BatchCoalescer:
+    """
+    Coalesce concurrent requests into provider batch calls.
+
+    Requests submitted within a short time window that share the same
+    (provider, model, temperature) are drained into a single
+    `BaseLLMClient.generate_batch` call. Each caller awaits its own future
+    and receives exactly the response for its prompt.
+
+    Safety checks (validation, rate limiting, circuit breaking) are expected
+    to run per-request before submission, so batching does not change their
+    semantics.
+    """
+
+    def __init__(
+        self,
+        client_getter: Callable[[str], BaseLLMClient],
+        max_batch_size: int = 8,
+        max_wait_ms: float = 10.0,
+    ):
+        """
+        Initialize batch coalescer.
+
+        Args:
+            client_getter: Callable returning the LLM client for a provider
+            max_batch_size: Maximum requests per provider batch call
+            max_wait_ms: Maximum time to wait for a batch to fill
+        """
+        self._client_getter = client_getter
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_ms / 1000.0
+
+        self._queues: Dict[BatchKey, asyncio.Queue] = {}
+        self._workers: Dict[BatchKey, asyncio.Task] = {}
+
+    async def submit(
+        self, context: RequestContext, provider: str, model: str
+    ) -> LLMResponse:
+        """
+        Submit a request for batched execution.
+
+        Args:
+            context: Request context
+            provider: LLM provider name
+            model: Model identifier
+
+        Returns:
+            LLMResponse for this request
+
+        Raises:
+            Exception: Re-raises errors from the underlying batch call
+        """
+        key: BatchKey = (provider, model, context.temperature)
+        queue = self._get_queue(key)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        queue.put_nowait((context, future))
+
+        return await future
+
+    def _get_queue(self, key: BatchKey) -> asyncio.Queue:
+        """
+        Get or create the queue (and worker task) for a batch key.
+
+        Args:
+            key: Batch key
+
+        Returns:
+            Queue for the key
+        """
+        if key not in self._queues:
+            self._queues[key] = asyncio.Queue()
+            self._workers[key] = asyncio.create_task(self._worker(key))
+        return self._queues[key]
+
+    async def _worker(self, key: BatchKey) -> None:
+        """
+        Background worker draining one batch key.
+
+        Args:
+            key: Batch key to serve
+        """
+        provider, model, _ = key
+        queue = self._queues[key]
+
+        while True:
+            # Block until at least one request arrives
+            batch = [await queue.get()]
+
+            # Drain until the batch is full or the window elapses
+            try:
+                await collect_batch(
+                    queue, batch, self.max_batch_size, self.max_wait_seconds
+                )
+            except asyncio.CancelledError:
+                # aclose()/loop teardown cancelled the worker: release
+                # the callers whose futures it holds instead of
+                # stranding them
+                for _, future in batch:
+                    if not future.done():
+                        future.cancel()
+                raise
+
+            await self._dispatch(provider, model, batch)
+
+    async def _dispatch(
+        self,
+        provider: str,
+        model: str,
+        batch: List[Tuple[RequestContext, asyncio.Future]],
+    ) -> None:
+        """
+        Execute one batch and fan results back onto per-request futures.
+
+        Args:
+            provider: LLM provider name
+            model: Model identifier
+            batch: List of (context, future) pairs
+        """
+        contexts = [context for context, _ in batch]
+
+        try:
+            client = self._client_getter(provider)
+            responses = await client.generate_batch(contexts, model)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), response in zip(batch, responses):
+            if not future.done():
+                if isinstance(response, Exception):
+                    future.set_exception(response)
+                else:
+                    future.set_result(response)
+
+    async def aclose(self) -> None:
+        """Cancel all background workers and fail pending requests."""
+        for worker in self._workers.values():
+            worker.cancel()
+
+        for queue in self._queues.values():
+            while not queue.empty():
+                _, future = queue.get_nowait()
+                if not future.done():
+                    future.cancel()
+
+        self._workers.clear()
+        self._queues.clear()
@@ -5,6 +5,7 @@ Uses Pydantic Settings to load configuration from environment variables
 and .env files with type safety and validation.
 """
 
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
@@ -43,6 +44,10 @@ class MonitoringConfig(BaseSettings):
         ge=1,
     )
 
+    def frozen(self) -> "MonitoringConfigView":
+        """Snapshot into an immutable view for hot-path attribute reads."""
+        return MonitoringConfigView(**self.model_dump())
+
 
 class SafetyConfig(BaseSettings):
     """Configuration for safety mechanisms."""
@@ -74,6 +79,10 @@ class SafetyConfig(BaseSettings):
         description="Enable content safety filtering",
     )
 
+    def frozen(self) -> "SafetyConfigView":
+        """Snapshot into an immutable view for hot-path attribute reads."""
+        return SafetyConfigView(**self.model_dump())
+
 
 class RateLimitConfig(BaseSettings):
     """Configuration for rate limiting."""
@@ -106,6 +115,10 @@ class RateLimitConfig(BaseSettings):
         ge=0.0,
     )
 
+    def frozen(self) -> "RateLimitConfigView":
+        """Snapshot into an immutable view for hot-path attribute reads."""
+        return RateLimitConfigView(**self.model_dump())
+
 
 class RetryConfig(BaseSettings):
     """Configuration for retry strategy."""
@@ -142,6 +155,65 @@ class RetryConfig(BaseSettings):
         default=True,
         description="Enable jitter to prevent thundering herd",
     )
+    worker_pool_size: int = Field(
+        default=32,
+        description="Worker tasks in the retry pool (caps concurrent retries)",
+        ge=1,
+    )
+
+    def frozen(self) -> "RetryConfigView":
+        """Snapshot into an immutable view for hot-path attribute reads."""
+        return RetryConfigView(**self.model_dump())
+
+
+# Frozen runtime views.
+#
+# Settings are only mutated at load time; components read them on every
+# request, where Pydantic attribute access costs a descriptor call. These
+# slotted frozen mirrors give C-level attribute reads and are what the
+# guardian hands to its components.
+
+
+@dataclass(slots=True, frozen=True)
+class MonitoringConfigView:
+    """Immutable runtime view of MonitoringConfig."""
+
+    quality_alert_threshold: float
+    performance_alert_threshold_ms: float
+    enable_anomaly_detection: bool
+    metrics_retention_days: int
+
+
+@dataclass(slots=True, frozen=True)
+class SafetyConfigView:
+    """Immutable runtime view of SafetyConfig."""
+
+    circuit_breaker_threshold: int
+    circuit_recovery_seconds: int
+    max_prompt_length: int
+    enable_content_filtering: bool
+
+
+@dataclass(slots=True, frozen=True)
+class RateLimitConfigView:
+    """Immutable runtime view of RateLimitConfig."""
+
+    global_max_requests_per_minute: int
+    user_max_requests_per_minute: int
+    user_daily_quota_usd: Optional[float]
+    session_budget_usd: Optional[float]
+
+
+@dataclass(slots=True, frozen=True)
+class RetryConfigView:
+    """Immutable runtime view of RetryConfig."""
+
+    max_attempts: int
+    initial_delay_seconds: float
+    max_delay_seconds: float
+    exponential_base: float
+    enable_jitter: bool
+    worker_pool_size: int
 
 
 class GuardianConfig(BaseSettings):
@@ -178,6 +250,11 @@ class GuardianConfig(BaseSettings):
         default=Path("/tmp/llm_guardian/audit"),
         description="Path for audit logs",
     )
+    audit_log_response_body: bool = Field(
+        default=False,
+        description="Log response text previews in the audit log; when off, "
+        "only a content hash and length are recorded",
+    )
 
     # Fallback provider configuration
     fallback_provider: Optional[str] = Field(
@@ -189,6 +266,22 @@ class GuardianConfig(BaseSettings):
         description="Fallback model to use",
     )
 
+    # Request batching
+    enable_request_batching: bool = Field(
+        default=False,
+        description="Coalesce concurrent requests into provider batch calls",
+    )
+    batch_max_size: int = Field(
+        default=8,
+        description="Maximum requests per coalesced batch",
+        ge=1,
+    )
+    batch_max_wait_ms: float = Field(
+        default=10.0,
+        description="Maximum milliseconds to wait for a batch to fill",
+        ge=0.0,
+    )
+
     # Feature flags
     enable_monitoring: bool = Field(
         default=True,
@@ -10,27 +10,40 @@ Implements all three core principles:
 3. Fundamental design quality
 """
 
+import atexit
+import itertools
+import os
+import signal
+import time
 from datetime import timedelta
 from typing import Dict, Optional
 
+import httpx
+
 from llm_guardian.core.config import GuardianConfig
 from llm_guardian.core.exceptions import (
     MissingAPIKeyError,
     UnsupportedProviderError,
     ValidationError,
 )
-from llm_guardian.core.models import LLMResponse, RequestContext, ResponseQuality
-from llm_guardian.integrations.anthropic_client import AnthropicClient
+from llm_guardian.core.batching import BatchCoalescer
+from llm_guardian.core.models import (
+    LLMResponse,
+    RequestContext,
+    ResponseQuality,
+    Severity,
+    ValidationResult,
+)
 from llm_guardian.integrations.base import BaseLLMClient
-from llm_guardian.integrations.openai_client import OpenAIClient
 from llm_guardian.monitoring.performance_monitor import PerformanceMonitor
 from llm_guardian.monitoring.quality_monitor import QualityMonitor
-from llm_guardian.recovery.audit_logger import AuditLogger
+from llm_guardian.recovery.audit_logger import AuditLogger, request_id_var
 from llm_guardian.recovery.retry_manager import RetryManager
 from llm_guardian.recovery.state_manager import StateManager
 from llm_guardian.safety.circuit_breaker import CircuitBreaker
 from llm_guardian.safety.rate_limiter import RateLimiter
 from llm_guardian.safety.validators import InputValidator, OutputValidator
+from llm_guardian.utils.serialization import dump_jsonable
 
 
 class LLMGuardian:
@@ -56,41 +69,147 @@ class LLMGuardian:
         """
         self.config = config
 
+        # Cache hot config values as plain attributes: reading them through
+        # the Pydantic model costs a descriptor call per access on every
+        # request.
+        self._enable_safety = config.enable_safety_checks
+        self._enable_monitoring = config.enable_monitoring
+        self._enable_recovery = config.enable_recovery
+        self._fallback_provider = config.fallback_provider
+        self._fallback_model = config.fallback_model
+        self._audit_body = config.audit_log_response_body
+
         # Validate configuration
         if config.enable_safety_checks:
             config.validate_required_keys()
 
-        # Initialize monitoring components (Principle 1)
-        self.quality_monitor = QualityMonitor(config.monitoring)
-        self.performance_monitor = PerformanceMonitor(config.monitoring)
+        # Initialize monitoring components (Principle 1); skipped entirely
+        # when monitoring is disabled to avoid their memory and setup cost
+        self.quality_monitor: Optional[QualityMonitor] = None
+        self.performance_monitor: Optional[PerformanceMonitor] = None
+        if config.enable_monitoring:
+            monitoring_view = config.monitoring.frozen()
+            self.quality_monitor = QualityMonitor(monitoring_view)
+            self.performance_monitor = PerformanceMonitor(monitoring_view)
 
         # Initialize safety mechanisms (Principle 2)
         self.circuit_breaker = CircuitBreaker(
             failure_threshold=config.safety.circuit_breaker_threshold,
-            recovery_timeout=timedelta(seconds=config.safety.circuit_recovery_seconds),
+            recovery_timeout_seconds=config.safety.circuit_recovery_seconds,
         )
-        self.rate_limiter = RateLimiter(config.rate_limiting)
+        self.rate_limiter = RateLimiter(config.rate_limiting.frozen())
 
-        # Initialize validators (Principle 3)
-        self.input_validator = InputValidator(config.safety)
-        self.output_validator = OutputValidator(config.safety)
+        # Initialize validators (Principle 3); skipped when safety checks
+        # are disabled
+        self.input_validator: Optional[InputValidator] = None
+        self.output_validator: Optional[OutputValidator] = None
+        if config.enable_safety_checks:
+            safety_view = config.safety.frozen()
+            self.input_validator = InputValidator(safety_view)
+            self.output_validator = OutputValidator(safety_view)
 
         # Initialize recovery systems (Principle 2)
-        self.retry_manager = RetryManager(config.retry_strategy)
+        self.retry_manager = RetryManager(config.retry_strategy.frozen())
         self.state_manager = StateManager(config.state_storage_path)
         self.audit_logger = AuditLogger(config.audit_log_path)
 
+        # Shared HTTP connection pool for all provider clients.
+        # Reusing one pool avoids per-request TLS handshakes under load;
+        # HTTP/2 (when the optional h2 package is installed) multiplexes
+        # concurrent generations over fewer connections. SDK versions
+        # that vendor their own httpx fork reject an injected client; the
+        # provider adapters detect that and fall back to SDK-owned pools.
+        _http_kwargs = {
+            "timeout": httpx.Timeout(60.0, connect=5.0),
+            "limits": httpx.Limits(max_connections=200, max_keepalive_connections=100),
+        }
+        try:
+            self._http = httpx.AsyncClient(http2=True, **_http_kwargs)
+        except ImportError:
+            self._http = httpx.AsyncClient(**_http_kwargs)
+
         # LLM client adapters
         self.llm_clients: Dict[str, BaseLLMClient] = {}
         self._initialize_clients()
 
+        # In-flight requests awaiting their completion checkpoint. Flushed
+        # to state storage only if the process is interrupted, replacing a
+        # per-request pre-execution checkpoint write.
+        self._inflight: Dict[str, RequestContext] = {}
+        if config.enable_recovery:
+            self._register_shutdown_flush()
+
+        # Table-driven handling of failed output validation, keyed by
+        # severity: one dict lookup on the hot path instead of string
+        # comparisons, and new severities slot in without touching
+        # execute_request.
+        self._severity_actions = {
+            Severity.LOW: self._keep_invalid_output,
+            Severity.MEDIUM: self._keep_invalid_output,
+            Severity.HIGH: self._keep_invalid_output,
+            Severity.CRITICAL: self._reject_invalid_output,
+        }
+
+        # Monotonic request-ID counter, seeded from wall time so IDs stay
+        # unique across restarts without per-call datetime formatting
+        self._id_counter = itertools.count(int(time.time() * 1e6))
+
+        # Optional micro-batching of concurrent requests
+        self.batch_coalescer: Optional[BatchCoalescer] = None
+        if config.enable_request_batching:
+            self.batch_coalescer = BatchCoalescer(
+                client_getter=self._get_llm_client,
+                max_batch_size=config.batch_max_size,
+                max_wait_ms=config.batch_max_wait_ms,
+            )
+
     def _initialize_clients(self) -> None:
-        """Initialize LLM provider clients."""
+        """
+        Initialize LLM provider clients.
+
+        Provider modules are imported here rather than at module level:
+        each SDK pulls in a large dependency tree, and deferring the import
+        keeps `from llm_guardian import LLMGuardian` fast for processes
+        that configure only one provider (or none).
+        """
         if self.config.anthropic_api_key:
-            self.llm_clients["anthropic"] = AnthropicClient(self.config.anthropic_api_key)
+            from llm_guardian.integrations.anthropic_client import AnthropicClient
+
+            self.llm_clients["anthropic"] = AnthropicClient(
+                self.config.anthropic_api_key, http_client=self._http
+            )
 
         if self.config.openai_api_key:
-            self.llm_clients["openai"] = OpenAIClient(self.config.openai_api_key)
+            from llm_guardian.integrations.openai_client import OpenAIClient
+
+            self.llm_clients["openai"] = OpenAIClient(
+                self.config.openai_api_key, http_client=self._http
+            )
+
+        # Bound-method lookup used on the retry hot path: one dict .get
+        # per attempt instead of a method call plus membership check.
+        self._clients_get = self.llm_clients.get
+
+    def new_request_id(self) -> str:
+        """
+        Generate a unique request identifier.
+
+        Combines the process ID with a monotonic counter; cheaper than
+        timestamp formatting and safe to call from hot loops.
+
+        Returns:
+            Unique request ID string
+        """
+        return f"{os.getpid():x}-{next(self._id_counter):012x}"
+
+    async def aclose(self) -> None:
+        """Release shared resources (HTTP pool, batch workers)."""
+        if self.batch_coalescer is not None:
+            await self.batch_coalescer.aclose()
+        await self.audit_logger.aclose()
+        for client in self.llm_clients.values():
+            await client.aclose()
+        await self._http.aclose()
 
     async def execute_request(
         self,
@@ -126,22 +245,22 @@ class LLMGuardian:
             CircuitBreakerOpenError: If circuit breaker is open
             Exception: Other errors from LLM providers
         """
+        request_id_var.set(context.request_id)
+
         # 1. Audit logging - log incoming request
         self.audit_logger.log_request(context)
 
         try:
             # 2. Input validation (Principle 3: Validation at boundaries)
-            if self.config.enable_safety_checks:
-                await self.input_validator.validate_input(context)
+            if self._enable_safety:
+                self.input_validator.validate_input(context)
 
             # 3. Rate limiting check
             await self.rate_limiter.check_limits(context)
 
-            # 4. Save checkpoint for recovery
-            if self.config.enable_recovery:
-                await self.state_manager.save_checkpoint(
-                    context.request_id, context, {"stage": "pre_execution"}
-                )
+            # 4. Track as in-flight for recovery (persisted only on interrupt)
+            if self._enable_recovery:
+                self._inflight[context.request_id] = context
 
             # 5. Execute with circuit breaker and retry (Principle 2: Recovery)
             try:
@@ -149,30 +268,30 @@ class LLMGuardian:
                     self._execute_with_retry, context, provider, model
                 )
             except Exception as e:
-                self.audit_logger.log_error(
+                self._log_error_once(
                     context.request_id, e, {"provider": provider, "model": model}
                 )
 
                 # Attempt graceful degradation
-                if self.config.fallback_provider and provider != self.config.fallback_provider:
+                if self._fallback_provider and provider != self._fallback_provider:
                     response = await self._handle_failure_with_fallback(context, e)
                 else:
                     raise
 
-            # 6. Quality monitoring (Principle 1: Early warning)
-            if self.config.enable_monitoring:
+            # 6+7. Quality and performance monitoring. record_metrics is
+            # pure CPU work and runs synchronously; quality assessment is
+            # awaited afterwards. Output validation stays sequential
+            # because it reads fields quality monitoring sets.
+            if self._enable_monitoring:
+                metrics = self.performance_monitor.record_metrics(response, context)
                 await self.quality_monitor.assess_quality(response, context)
 
-            # 7. Performance monitoring
-            if self.config.enable_monitoring:
-                metrics = await self.performance_monitor.record_metrics(response, context)
-
                 # Record cost for quota tracking
                 await self.rate_limiter.record_cost(context, metrics.cost_usd)
 
             # 8. Output validation (Principle 3: Validation at boundaries)
-            if self.config.enable_safety_checks:
-                validation_result = await self.output_validator.validate_output(response)
+            if self._enable_safety:
+                validation_result = self.output_validator.validate_output(response)
                 if not validation_result.is_valid:
                     # Log validation failure
                     self.audit_logger.log_error(
@@ -180,26 +299,20 @@ class LLMGuardian:
                         ValidationError(
                             f"Output validation failed: {validation_result.errors}"
                         ),
-                        {"validation_result": validation_result.model_dump()},
+                        {"validation_result": dump_jsonable(validation_result)},
                     )
 
-                    # For critical failures, attempt fallback or reject
-                    if validation_result.severity == "critical":
-                        if self.config.fallback_provider:
-                            response = await self._handle_failure_with_fallback(
-                                context, ValidationError("Critical validation failure")
-                            )
-                        else:
-                            raise ValidationError(
-                                "Output validation failed",
-                                details={"errors": validation_result.errors},
-                            )
+                    # Dispatch on severity via the precomputed action table
+                    action = self._severity_actions[
+                        Severity.from_str(validation_result.severity)
+                    ]
+                    response = await action(context, response, validation_result)
 
             # 9. Audit logging - log successful response
-            self.audit_logger.log_response(response)
+            self.audit_logger.log_response(response, include_body=self._audit_body)
 
-            # 10. Update checkpoint
-            if self.config.enable_recovery:
+            # 10. Save single completion checkpoint
+            if self._enable_recovery:
                 await self.state_manager.save_checkpoint(
                     context.request_id,
                     context,
@@ -209,10 +322,124 @@ class LLMGuardian:
             return response
 
         except Exception as e:
-            # Log all errors
-            self.audit_logger.log_error(context.request_id, e)
+            # Log all errors not already recorded by an inner handler
+            self._log_error_once(context.request_id, e)
             raise
 
+        finally:
+            self._inflight.pop(context.request_id, None)
+
+    def _log_error_once(
+        self,
+        request_id: str,
+        error: Exception,
+        error_context: Optional[Dict[str, any]] = None,
+    ) -> None:
+        """
+        Audit-log an error unless it was already logged on this request.
+
+        An exception raised inside the circuit-breaker block propagates
+        through the outer handler, which would otherwise write the same
+        error a second time — doubling error-path audit I/O exactly when
+        volume is highest.
+
+        Args:
+            request_id: Request identifier
+            error: Exception to log
+            error_context: Additional context for the audit record
+        """
+        if getattr(error, "_lg_logged", False):
+            return
+        self.audit_logger.log_error(request_id, error, error_context)
+        self._mark_logged(error)
+
+    @staticmethod
+    def _mark_logged(error: Exception) -> None:
+        """Flag an exception as already audit-logged."""
+        try:
+            error._lg_logged = True
+        except AttributeError:
+            # Slotted exceptions cannot carry the flag; worst case the
+            # error is logged twice
+            pass
+
+    async def _keep_invalid_output(
+        self,
+        context: RequestContext,
+        response: LLMResponse,
+        validation_result: ValidationResult,
+    ) -> LLMResponse:
+        """
+        Handle non-critical validation failure: keep the response.
+
+        Args:
+            context: Request context
+            response: Validated response
+            validation_result: Failed validation result
+
+        Returns:
+            The original response (failure is already audit-logged)
+        """
+        return response
+
+    async def _reject_invalid_output(
+        self,
+        context: RequestContext,
+        response: LLMResponse,
+        validation_result: ValidationResult,
+    ) -> LLMResponse:
+        """
+        Handle critical validation failure: fall back or reject.
+
+        Args:
+            context: Request context
+            response: Validated response
+            validation_result: Failed validation result
+
+        Returns:
+            Fallback response if a fallback provider is configured
+
+        Raises:
+            ValidationError: If no fallback provider is available
+        """
+        if self._fallback_provider:
+            return await self._handle_failure_with_fallback(
+                context, ValidationError("Critical validation failure")
+            )
+        raise ValidationError(
+            "Output validation failed",
+            details={"errors": validation_result.errors},
+        )
+
+    def _register_shutdown_flush(self) -> None:
+        """Flush in-flight requests to state storage on SIGTERM/exit."""
+        atexit.register(self._flush_inflight)
+
+        try:
+            previous = signal.getsignal(signal.SIGTERM)
+
+            def _on_sigterm(signum: int, frame: object) -> None:
+                self._flush_inflight()
+                if callable(previous):
+                    previous(signum, frame)
+                    return
+                # Die by the signal: restoring the default disposition and
+                # re-raising keeps the exit status at 128+SIGTERM, so
+                # supervisors see a termination rather than a clean exit
+                signal.signal(signum, signal.SIG_DFL)
+                os.kill(os.getpid(), signum)
+
+            signal.signal(signal.SIGTERM, _on_sigterm)
+        except ValueError:
+            # Not in the main thread; atexit still covers clean shutdown
+            pass
+
+    def _flush_inflight(self) -> None:
+        """Persist any in-flight requests as interrupted checkpoints."""
+        if self._inflight:
+            self.state_manager.flush_inflight(dict(self._inflight))
+            self._inflight.clear()
+
     async def _execute_with_retry(
         self, context: RequestContext, provider: str, model: str
     ) -> LLMResponse:
@@ -229,7 +456,14 @@ class LLMGuardian:
         """
 
         async def _call_llm() -> LLMResponse:
-            client = self._get_llm_client(provider)
+            if self.batch_coalescer is not None:
+                return await self.batch_coalescer.submit(context, provider, model)
+            client = self._clients_get(provider)
+            if client is None:
+                raise UnsupportedProviderError(
+                    f"Provider '{provider}' not configured. "
+                    f"Available: {list(self.llm_clients.keys())}"
+                )
             return await client.generate(context, model)
 
         return await self.retry_manager.execute_with_retry(_call_llm)
@@ -250,19 +484,20 @@ class LLMGuardian:
         Raises:
             Exception: If fallback also fails
         """
-        if not self.config.fallback_provider:
+        if not self._fallback_provider:
             raise error
 
         try:
             return await self._execute_with_retry(
-                context, self.config.fallback_provider, self.config.fallback_model or "gpt-3.5-turbo"
+                context, self._fallback_provider, self._fallback_model or "gpt-3.5-turbo"
             )
         except Exception as fallback_error:
-            self.audit_logger.log_error(
+            self._log_error_once(
                 context.request_id,
                 fallback_error,
                 {"fallback_attempted": True, "original_error": str(error)},
             )
+            self._mark_logged(error)
             raise error from fallback_error
 
     def _get_llm_client(self, provider: str) -> BaseLLMClient:
@@ -278,12 +513,13 @@ class LLMGuardian:
         Raises:
             UnsupportedProviderError: If provider not supported or configured
         """
-        if provider not in self.llm_clients:
+        client = self._clients_get(provider)
+        if client is None:
             raise UnsupportedProviderError(
                 f"Provider '{provider}' not configured. Available: {list(self.llm_clients.keys())}"
             )
 
-        return self.llm_clients[provider]
+        return client
 
     def get_quality_trends(self, window_size: int = 100) -> Dict[str, any]:
         """
@@ -293,8 +529,10 @@ class LLMGuardian:
             window_size: Number of recent samples
 
         Returns:
-            Quality trends
+            Quality trends (empty when monitoring is disabled)
         """
+        if self.quality_monitor is None:
+            return {}
         return self.quality_monitor.get_quality_trends(window_size)
 
     def get_performance_summary(
@@ -307,8 +545,10 @@ class LLMGuardian:
             time_window: Optional time window
 
         Returns:
-            Performance statistics
+            Performance statistics (empty when monitoring is disabled)
         """
+        if self.performance_monitor is None:
+            return {}
         return self.performance_monitor.get_performance_summary(time_window)
 
     def get_circuit_breaker_status(self) -> Dict[str, any]:
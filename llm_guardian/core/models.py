@@ -5,15 +5,46 @@ Implements Principle 3: Fundamental design quality through Pydantic models
 with explicit contracts and validation at boundaries.
 """
 
-from datetime import datetime
-from enum import Enum
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum, IntEnum
+from typing import Any, Dict, List, Literal, Optional, Sequence
 
 from pydantic import BaseModel, Field, field_validator
 
+_UTC = timezone.utc
+
+
+def _now_utc() -> datetime:
+    """Timezone-aware UTC now; shared default factory for timestamp fields.
+
+    datetime.utcnow is deprecated and returns naive datetimes that
+    pydantic-core must special-case on serialization; aware UTC values
+    take the fast path.
+    """
+    return datetime.now(_UTC)
+
+
+# LLMResponse.quality_level uses this Literal: pydantic-core validates
+# Literals with a single hash lookup, where the str Enum forced a coercion
+# through the enum value map on every validated construction
+QualityLevel = Literal["excellent", "good", "acceptable", "poor", "unsafe"]
+
+# Closed string vocabularies for the internal dataclasses. Annotating with
+# Literal documents the contract and lets type checkers enforce it without
+# any runtime regex or enum machinery.
+SeverityLevel = Literal["low", "medium", "high", "critical"]
+AlertCategory = Literal["quality", "performance", "safety", "anomaly", "budget"]
+RecommendedAction = Literal["accept", "reject", "review", "fallback"]
+
 
 class ResponseQuality(str, Enum):
-    """Quality levels for LLM responses."""
+    """
+    Quality levels for LLM responses.
+
+    Members are plain strings and compare equal to the QualityLevel
+    literals; this enum remains the constants namespace for call sites.
+    """
 
     EXCELLENT = "excellent"
     GOOD = "good"
@@ -22,16 +53,51 @@ class ResponseQuality(str, Enum):
     UNSAFE = "unsafe"
 
 
+class Severity(IntEnum):
+    """
+    Ordered severity levels for validation results and alerts.
+
+    Integer values allow table-driven dispatch and cheap comparisons on
+    hot paths while the string form remains the wire format.
+    """
+
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+    CRITICAL = 3
+
+    @classmethod
+    def from_str(cls, value: str) -> "Severity":
+        """
+        Parse the string severity used in models and configs.
+
+        Args:
+            value: One of "low", "medium", "high", "critical"
+
+        Returns:
+            Matching Severity member
+        """
+        return _SEVERITY_BY_NAME[value]
+
+
+_SEVERITY_BY_NAME = {member.name.lower(): member for member in Severity}
+
+
 class RequestContext(BaseModel):
     """
     Complete context for an LLM request with all assumptions explicit.
 
     This model enforces contracts at the boundary and makes all assumptions
     visible in the code (Principle 3).
+
+    Example:
+        RequestContext(request_id="req-12345", user_id="user-123",
+        prompt="Explain quantum computing", max_tokens=500,
+        temperature=0.7, max_cost_usd=0.10)
     """
 
     request_id: str = Field(..., description="Unique request identifier", min_length=1)
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Request timestamp")
+    timestamp: datetime = Field(default_factory=_now_utc, description="Request timestamp")
 
     # User context
     user_id: Optional[str] = Field(None, description="User identifier")
@@ -62,23 +128,29 @@ class RequestContext(BaseModel):
     @classmethod
     def validate_prompt_not_empty(cls, v: str) -> str:
         """Ensure prompt is not just whitespace."""
-        if not v.strip():
+        # isspace short-circuits on the first non-space char; strip() would
+        # copy the whole prompt (up to 100KB) just to test emptiness
+        if not v or v.isspace():
             raise ValueError("Prompt cannot be empty or whitespace only")
         return v
 
-    class Config:
-        """Pydantic model configuration."""
+    @classmethod
+    def trusted(cls, **fields: Any) -> "RequestContext":
+        """
+        Construct a context without running field validation.
+
+        Intended for internally generated requests (retries, fallback
+        paths, batch fan-out) whose fields were already validated once at
+        the boundary; skips the full Pydantic validation pass. External
+        input must keep using the validating constructor.
 
-        json_schema_extra = {
-            "example": {
-                "request_id": "req-12345",
-                "user_id": "user-123",
-                "prompt": "Explain quantum computing",
-                "max_tokens": 500,
-                "temperature": 0.7,
-                "max_cost_usd": 0.10,
-            }
-        }
+        Args:
+            **fields: Field values; unset fields receive their defaults
+
+        Returns:
+            RequestContext built via model_construct
+        """
+        return cls.model_construct(**fields)
 
 
 class LLMResponse(BaseModel):
@@ -101,8 +173,8 @@ class LLMResponse(BaseModel):
     quality_score: float = Field(
         default=0.0, description="Overall quality score", ge=0.0, le=1.0
     )
-    quality_level: ResponseQuality = Field(
-        default=ResponseQuality.ACCEPTABLE, description="Quality level"
+    quality_level: QualityLevel = Field(
+        default="acceptable", description="Quality level"
     )
 
     # Safety flags (populated by monitoring)
@@ -119,181 +191,133 @@ class LLMResponse(BaseModel):
     # Provider metadata
     provider: str = Field(..., description="LLM provider name")
     model: str = Field(..., description="Model identifier")
+    # Kept as a dict: the monitors read raw_response["usage"] per request,
+    # and the provider clients build responses via model_construct, so this
+    # field is never walked by the validator on the hot path
     raw_response: Dict[str, Any] = Field(..., description="Raw provider response")
 
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow, description="Response timestamp"
+        default_factory=_now_utc, description="Response timestamp"
     )
 
-    class Config:
-        """Pydantic model configuration."""
-
-        json_schema_extra = {
-            "example": {
-                "request_id": "req-12345",
-                "response_text": "Quantum computing uses quantum mechanics...",
-                "latency_ms": 1250.5,
-                "tokens_used": 150,
-                "cost_usd": 0.0045,
-                "quality_score": 0.85,
-                "quality_level": "good",
-                "provider": "anthropic",
-                "model": "claude-3-5-sonnet-20241022",
-                "raw_response": {},
-            }
-        }
-
-
-class MonitoringAlert(BaseModel):
-    """Alert raised by monitoring system when issues are detected."""
-
-    alert_id: str = Field(..., description="Unique alert identifier")
-    severity: str = Field(
-        ...,
-        description="Alert severity level",
-        pattern="^(low|medium|high|critical)$",
-    )
-    category: str = Field(
-        ...,
-        description="Alert category",
-        pattern="^(quality|performance|safety|anomaly|budget)$",
-    )
-    message: str = Field(..., description="Human-readable alert message")
-    details: Dict[str, Any] = Field(default_factory=dict, description="Additional details")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Alert timestamp")
-    resolved: bool = Field(default=False, description="Whether alert has been resolved")
 
-    # Optional reference to related request
-    request_id: Optional[str] = Field(None, description="Related request ID if applicable")
+@dataclass(slots=True)
+class AlertDetails:
+    """
+    Fixed-shape payload for performance alerts.
 
-    class Config:
-        """Pydantic model configuration."""
+    Slotted fields instead of a five-entry dict per alert: an alert
+    storm (e.g. a provider outage tripping the latency threshold on
+    every request) otherwise allocates and hashes a dict per request.
+    """
 
-        json_schema_extra = {
-            "example": {
-                "alert_id": "alert-789",
-                "severity": "high",
-                "category": "quality",
-                "message": "Quality score below threshold",
-                "details": {"quality_score": 0.45, "threshold": 0.6},
-                "request_id": "req-12345",
-            }
-        }
+    latency_ms: float
+    tokens_used: int
+    cost_usd: float
+    provider: str
+    model: str
 
 
-class QualityAssessment(BaseModel):
-    """Detailed quality assessment for an LLM response."""
+@dataclass(slots=True)
+class MonitoringAlert:
+    """
+    Alert raised by monitoring system when issues are detected.
+
+    Plain slotted dataclass: instances are created only by the monitors
+    with already-known-good values, so the full pydantic validation pass
+    would be pure overhead.
+    """
+
+    alert_id: str
+    severity: SeverityLevel
+    category: AlertCategory
+    message: str
+    # Free-form dict for quality alerts, fixed-shape AlertDetails for
+    # performance alerts
+    details: Any = field(default_factory=dict)
+    timestamp: datetime = field(default_factory=_now_utc)
+    resolved: bool = False
+
+    # Optional reference to related request
+    request_id: Optional[str] = None
+
+
+@dataclass(slots=True)
+class QualityAssessment:
+    """
+    Detailed quality assessment for an LLM response.
+
+    Slotted dataclass built and filled by QualityMonitor on every request;
+    scores are in [0, 1] by construction.
+    """
 
-    request_id: str = Field(..., description="Request identifier")
+    request_id: str
 
     # Quality scores
-    hallucination_probability: float = Field(
-        default=0.0,
-        description="Probability that response is a hallucination",
-        ge=0.0,
-        le=1.0,
-    )
-    safety_violations: List[str] = Field(
-        default_factory=list, description="List of safety violations detected"
-    )
-    coherence_score: float = Field(
-        default=1.0, description="Response coherence score", ge=0.0, le=1.0
-    )
-    relevance_score: float = Field(
-        default=1.0, description="Response relevance to prompt", ge=0.0, le=1.0
-    )
+    hallucination_probability: float = 0.0
+    safety_violations: List[str] = field(default_factory=list)
+    coherence_score: float = 1.0
+    relevance_score: float = 1.0
 
     # Recommendations
-    pass_validation: bool = Field(
-        default=True, description="Whether response passes validation"
-    )
-    recommended_action: str = Field(
-        default="accept",
-        description="Recommended action",
-        pattern="^(accept|reject|review|fallback)$",
-    )
-    warnings: List[str] = Field(default_factory=list, description="Quality warnings")
+    pass_validation: bool = True
+    recommended_action: RecommendedAction = "accept"
+    warnings: List[str] = field(default_factory=list)
+
+    timestamp: datetime = field(default_factory=_now_utc)
 
-    timestamp: datetime = Field(
-        default_factory=datetime.utcnow, description="Assessment timestamp"
-    )
 
+@dataclass(slots=True)
+class PerformanceMetrics:
+    """
+    Performance metrics for an LLM request.
 
-class PerformanceMetrics(BaseModel):
-    """Performance metrics for an LLM request."""
+    Slotted dataclass created once per request by PerformanceMonitor from
+    an already-validated LLMResponse; counts and costs are non-negative by
+    construction.
+    """
 
-    request_id: str = Field(..., description="Request identifier")
-    latency_ms: float = Field(..., description="Latency in milliseconds", ge=0.0)
+    request_id: str
+    latency_ms: float
 
     # Token metrics
-    tokens_prompt: int = Field(..., description="Prompt tokens", ge=0)
-    tokens_completion: int = Field(..., description="Completion tokens", ge=0)
-    tokens_total: int = Field(..., description="Total tokens", ge=0)
+    tokens_prompt: int
+    tokens_completion: int
+    tokens_total: int
 
     # Cost metrics
-    cost_usd: float = Field(..., description="Request cost in USD", ge=0.0)
+    cost_usd: float
 
     # Provider info
-    provider: str = Field(..., description="LLM provider")
-    model: str = Field(..., description="Model identifier")
-
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Metrics timestamp")
+    provider: str
+    model: str
 
-    class Config:
-        """Pydantic model configuration."""
+    timestamp: datetime = field(default_factory=_now_utc)
 
-        json_schema_extra = {
-            "example": {
-                "request_id": "req-12345",
-                "latency_ms": 1250.5,
-                "tokens_prompt": 50,
-                "tokens_completion": 100,
-                "tokens_total": 150,
-                "cost_usd": 0.0045,
-                "provider": "anthropic",
-                "model": "claude-3-5-sonnet-20241022",
-            }
-        }
 
-
-class StateSnapshot(BaseModel):
+@dataclass(slots=True)
+class StateSnapshot:
     """Snapshot of system state for recovery purposes."""
 
-    snapshot_id: str = Field(..., description="Unique snapshot identifier")
-    request_context: RequestContext = Field(..., description="Request context")
-    response: Optional[LLMResponse] = Field(None, description="Response if available")
-    checkpoint_data: Dict[str, Any] = Field(
-        default_factory=dict, description="Additional checkpoint data"
-    )
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Snapshot timestamp")
-
-    class Config:
-        """Pydantic model configuration."""
-
-        # Allow arbitrary types for nested models
-        arbitrary_types_allowed = True
+    snapshot_id: str
+    request_context: RequestContext
+    response: Optional[LLMResponse] = None
+    checkpoint_data: Dict[str, Any] = field(default_factory=dict)
+    timestamp: datetime = field(default_factory=_now_utc)
 
 
-class ValidationResult(BaseModel):
-    """Result of input or output validation."""
+@dataclass(slots=True, frozen=True)
+class ValidationResult:
+    """
+    Result of input or output validation.
 
-    is_valid: bool = Field(..., description="Whether validation passed")
-    errors: List[str] = Field(default_factory=list, description="Validation errors")
-    warnings: List[str] = Field(default_factory=list, description="Validation warnings")
-    severity: str = Field(
-        default="low",
-        description="Severity if invalid",
-        pattern="^(low|medium|high|critical)$",
-    )
+    Frozen slotted dataclass: validators accumulate findings in locals
+    and build the result once, so instances are immutable and the shared
+    all-clear singleton can be returned from any validation safely. The
+    sequences may be lists or tuples; callers only read them.
+    """
 
-    class Config:
-        """Pydantic model configuration."""
-
-        json_schema_extra = {
-            "example": {
-                "is_valid": False,
-                "errors": ["Prompt exceeds maximum length"],
-                "warnings": ["Unusual prompt structure detected"],
-                "severity": "medium",
-            }
-        }
+    is_valid: bool
+    errors: Sequence[str] = ()
+    warnings: Sequence[str] = ()
+    severity: SeverityLevel = "low"
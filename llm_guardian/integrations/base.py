@@ -4,9 +4,11 @@ Base LLM client interface.
 Defines the contract for LLM provider integrations.
 """
 
+import asyncio
+import os
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from llm_guardian.core.models import LLMResponse, RequestContext
 
@@ -18,14 +20,26 @@ class BaseLLMClient(ABC):
     All provider implementations must inherit from this class.
     """
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, http_client: Any = None):
         """
         Initialize LLM client.
 
         Args:
             api_key: Provider API key
+            http_client: Optional shared httpx.AsyncClient. When provided
+                and accepted by the SDK, the provider reuses its connection
+                pool instead of opening a session per client; subclasses
+                whose SDK rejects it reset this to None and let the SDK
+                own its pool.
         """
         self.api_key = api_key
+        self.http_client = http_client
+
+        # Bounds concurrent generations per client so a large batch cannot
+        # exhaust the shared connection pool; with HTTP/2 this is the number
+        # of streams multiplexed in flight
+        self._max_concurrency = int(os.getenv("LLM_GUARDIAN_CONCURRENCY", "32"))
+        self._sem = asyncio.Semaphore(self._max_concurrency)
 
     @abstractmethod
     async def generate(self, context: RequestContext, model: str) -> LLMResponse:
@@ -44,6 +58,49 @@ class BaseLLMClient(ABC):
         """
         pass
 
+    async def generate_batch(
+        self, contexts: List[RequestContext], model: str
+    ) -> List[LLMResponse]:
+        """
+        Generate responses for a batch of coalesced requests.
+
+        The default implementation dispatches the requests concurrently over
+        the shared connection, bounded by the per-client semaphore
+        (LLM_GUARDIAN_CONCURRENCY, default 32). Providers with a native
+        batch endpoint can override this with a single batched API call.
+
+        Args:
+            contexts: Request contexts sharing the same model parameters
+            model: Model identifier
+
+        Returns:
+            List of LLMResponse (or Exception) entries, one per context,
+            in the same order as `contexts`
+
+        Raises:
+            LLMProviderError: If batch dispatch fails entirely
+        """
+
+        async def _bounded(context: RequestContext) -> LLMResponse:
+            async with self._sem:
+                return await self.generate(context, model)
+
+        return await asyncio.gather(
+            *(_bounded(context) for context in contexts),
+            return_exceptions=True,
+        )
+
+    async def aclose(self) -> None:
+        """
+        Close the provider SDK client and any connection pool it owns.
+
+        A shared http_client injected by the caller is left open — the
+        caller owns its lifecycle.
+        """
+        client = getattr(self, "client", None)
+        if client is not None and self.http_client is None:
+            await client.close()
+
     @abstractmethod
     def estimate_cost(self, tokens_prompt: int, tokens_completion: int, model: str) -> float:
         """
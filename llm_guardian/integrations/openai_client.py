@@ -1,19 +1,23 @@
 """OpenAI GPT client implementation."""
 
 import time
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict
 
-import openai
-
-from llm_guardian.core.exceptions import LLMProviderAPIError, LLMProviderTimeoutError
-from llm_guardian.core.models import LLMResponse, RequestContext
+from llm_guardian.core.exceptions import (
+    LLMProviderAPIError,
+    LLMProviderRateLimitError,
+    LLMProviderTimeoutError,
+)
+from llm_guardian.core.models import LLMResponse, RequestContext, ResponseQuality
 from llm_guardian.integrations.base import BaseLLMClient
 
 
 class OpenAIClient(BaseLLMClient):
     """Client for OpenAI GPT API."""
 
+    PROVIDER_NAME = "openai"
+
     # Pricing per million tokens (as of January 2025)
     PRICING = {
         "gpt-4-turbo": {
@@ -30,15 +34,32 @@ class OpenAIClient(BaseLLMClient):
         },
     }
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, http_client: Any = None):
         """
         Initialize OpenAI client.
 
         Args:
             api_key: OpenAI API key
+            http_client: Optional shared httpx.AsyncClient
         """
-        super().__init__(api_key)
-        self.client = openai.AsyncOpenAI(api_key=api_key)
+        super().__init__(api_key, http_client=http_client)
+
+        # Imported here rather than at module top so the SDK's large model
+        # tree is only loaded when this provider is actually configured
+        import openai
+
+        self._timeout_error = openai.APITimeoutError
+        self._rate_limit_error = openai.RateLimitError
+        self._api_errors = (openai.APIStatusError, openai.APIConnectionError)
+        try:
+            self.client = openai.AsyncOpenAI(api_key=api_key, http_client=http_client)
+        except TypeError:
+            # SDK releases that vendor their own httpx fork type-check
+            # http_client and reject a plain httpx.AsyncClient. Fall back
+            # to an SDK-owned pool and clear http_client so aclose()
+            # knows this client owns its connections.
+            self.http_client = None
+            self.client = openai.AsyncOpenAI(api_key=api_key)
 
     async def generate(self, context: RequestContext, model: str) -> LLMResponse:
         """
@@ -56,7 +77,9 @@ class OpenAIClient(BaseLLMClient):
             LLMProviderTimeoutError: If request times out
         """
         try:
-            start_time = time.time()
+            # Monotonic interval clock: immune to NTP adjustments that could
+            # produce negative wall-clock latencies
+            start_ns = time.perf_counter_ns()
 
             response = await self.client.chat.completions.create(
                 model=model,
@@ -65,26 +88,37 @@ class OpenAIClient(BaseLLMClient):
                 messages=[{"role": "user", "content": context.prompt}],
             )
 
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter_ns() - start_ns) * 1e-6
 
             # Extract response text
             response_text = (
                 response.choices[0].message.content if response.choices else ""
             )
 
-            # Calculate cost
+            # Calculate cost inline (estimate_cost stays as the public API;
+            # the hot path skips the method dispatch)
             tokens_input = response.usage.prompt_tokens
             tokens_output = response.usage.completion_tokens
-            cost_usd = self.estimate_cost(tokens_input, tokens_output, model)
+            input_price, output_price = _PRICING_PER_TOKEN.get(model, _DEFAULT_PRICING)
+            cost_usd = tokens_input * input_price + tokens_output * output_price
 
-            return LLMResponse(
+            # Trusted internal assembly: every field is synthesized from SDK
+            # output, so skip the full validation pass. All fields are
+            # supplied explicitly because model_construct applies no defaults.
+            return LLMResponse.model_construct(
                 request_id=context.request_id,
                 response_text=response_text or "",
                 latency_ms=latency_ms,
                 tokens_used=tokens_input + tokens_output,
                 cost_usd=cost_usd,
+                quality_score=0.0,
+                quality_level=ResponseQuality.ACCEPTABLE,
+                contains_harmful_content=False,
+                is_hallucination=False,
+                is_off_task=False,
                 provider="openai",
                 model=model,
+                timestamp=datetime.now(timezone.utc),
                 raw_response={
                     "usage": {
                         "prompt_tokens": tokens_input,
@@ -96,11 +130,17 @@ class OpenAIClient(BaseLLMClient):
                 },
             )
 
-        except openai.APITimeoutError as e:
+        except self._timeout_error as e:
             raise LLMProviderTimeoutError(
                 f"OpenAI API timeout: {e}", details={"model": model}
             ) from e
-        except Exception as e:
+        except self._rate_limit_error as e:
+            # Transient and handled by the retry loop; skip __cause__
+            # chaining so error storms do not retain SDK traceback frames
+            raise LLMProviderRateLimitError(
+                f"OpenAI rate limit: {e}", details={"model": model}
+            ) from None
+        except self._api_errors as e:
             raise LLMProviderAPIError(
                 f"OpenAI API error: {e}", details={"model": model}
             ) from e
@@ -117,13 +157,18 @@ class OpenAIClient(BaseLLMClient):
         Returns:
             Cost in USD
         """
-        pricing = self.PRICING.get(model, self.PRICING["gpt-3.5-turbo"])
-
-        input_cost = (tokens_prompt / 1_000_000) * pricing["input"]
-        output_cost = (tokens_completion / 1_000_000) * pricing["output"]
-
-        return input_cost + output_cost
+        input_price, output_price = _PRICING_PER_TOKEN.get(model, _DEFAULT_PRICING)
+        return tokens_prompt * input_price + tokens_completion * output_price
 
     def get_provider_name(self) -> str:
         """Get provider name."""
-        return "openai"
+        return self.PROVIDER_NAME
+
+
+# Per-token prices derived once at import; estimate_cost then runs as two
+# multiplies and an add instead of nested dict lookups and divisions
+_PRICING_PER_TOKEN = {
+    model: (prices["input"] * 1e-6, prices["output"] * 1e-6)
+    for model, prices in OpenAIClient.PRICING.items()
+}
+_DEFAULT_PRICING = _PRICING_PER_TOKEN["gpt-3.5-turbo"]
@@ -5,13 +5,24 @@ Implements Principle 1: Monitoring as early warning system to identify
 gaps between assumptions and actual measurements.
 """
 
+import math
 import re
-from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, List, Optional, Set
 
 import numpy as np
 
-from llm_guardian.core.config import MonitoringConfig
+try:
+    # Optional linear-time regex engine (google-re2, in the "all" extra):
+    # RE2 compiles to a DFA, so adversarial response text cannot trigger
+    # the catastrophic backtracking possible with the stdlib engine
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+
+from llm_guardian.core.config import MonitoringConfigView
 from llm_guardian.core.exceptions import QualityCheckFailedError
 from llm_guardian.core.models import (
     LLMResponse,
@@ -22,6 +33,45 @@ from llm_guardian.core.models import (
 )
 
 
+def _compile_pattern(pattern: str, flags: int = re.IGNORECASE):
+    """
+    Compile a scanning pattern, preferring RE2 when installed.
+
+    Args:
+        pattern: Regex source
+        flags: Standard re flags (google-re2 accepts the same constants)
+
+    Returns:
+        Compiled pattern exposing the re match API
+    """
+    if _re2 is not None:
+        try:
+            return _re2.compile(pattern, flags)
+        except _re2.error:
+            # Pattern uses a construct RE2 rejects; keep stdlib semantics
+            pass
+    return re.compile(pattern, flags)
+
+
+# Tokenizer for already-lowercased text; plain [a-z]+ avoids both the
+# IGNORECASE machinery and the \b boundary checks per character
+_WORD_RE = re.compile(r"[a-z]+")
+
+# Common words excluded from keyword overlap, built once at import;
+# frozenset membership tests hash straight into the shared table
+_STOP_WORDS = frozenset(
+    {
+        "the", "a", "an", "and", "or", "but", "in", "on", "at", "to",
+        "for", "of", "with", "by", "from", "as", "is", "was", "are",
+        "were", "be", "been", "being", "have", "has", "had", "do",
+        "does", "did", "will", "would", "could", "should", "may",
+        "might", "can", "this", "that", "these", "those", "i", "you",
+        "he", "she", "it", "we", "they", "what", "which", "who",
+        "when", "where", "why", "how",
+    }
+)
+
+
 class HallucinationDetector:
     """
     Detect potential hallucinations in LLM responses.
@@ -38,8 +88,10 @@ class HallucinationDetector:
         """
         self.threshold = threshold
 
-        # Patterns that often indicate hallucinations or uncertainty
-        self.hallucination_patterns = [
+        # Patterns that often indicate hallucinations or uncertainty,
+        # compiled once so the per-response scan skips re's cache lookup
+        # and pattern interpretation
+        patterns = [
             r"I apologize,?\s+but I (don't|do not|cannot|can't) (actually|really)",
             r"I (made up|invented|fabricated)",
             r"I (don't|do not) have access to",
@@ -49,6 +101,14 @@ class HallucinationDetector:
             r"I'm not (sure|certain|confident)",
             r"I (may|might) be (wrong|incorrect|mistaken)",
         ]
+        self._compiled_patterns = [_compile_pattern(pattern) for pattern in patterns]
+
+        # Combined alternation: confident text (the common case) is
+        # cleared in one scan instead of eight; the per-pattern loop only
+        # runs after a hit to count how many markers fired
+        self._any_pattern_re = _compile_pattern(
+            "|".join(f"(?:{pattern})" for pattern in patterns)
+        )
 
     def detect(self, response: LLMResponse) -> float:
         """
@@ -81,8 +141,11 @@ class HallucinationDetector:
         Returns:
             Score based on pattern matches
         """
+        if self._any_pattern_re.search(text) is None:
+            return 0.0
+
         matches = sum(
-            1 for pattern in self.hallucination_patterns if re.search(pattern, text, re.IGNORECASE)
+            1 for pattern in self._compiled_patterns if pattern.search(text)
         )
 
         # Each match increases score by 0.3, capped at 1.0
@@ -98,7 +161,9 @@ class HallucinationDetector:
         Returns:
             Score based on length
         """
-        word_count = len(text.split())
+        # Separator count approximates the word count without split()
+        # allocating a list of substrings just to be measured
+        word_count = text.count(" ") + 1 if text else 0
 
         if word_count < 5:
             return 0.5
@@ -108,6 +173,21 @@ class HallucinationDetector:
             return 0.0
 
 
+@dataclass(slots=True)
+class SafetyResult:
+    """
+    Result of a content safety scan.
+
+    Slotted dataclass built once per check; attribute reads replace the
+    per-call nested dict the checker used to allocate.
+    """
+
+    is_safe: bool = True
+    violations: List[str] = field(default_factory=list)
+    risk_score: float = 0.0
+    details: Dict[str, float] = field(default_factory=dict)
+
+
 class ContentSafetyChecker:
     """
     Multi-layered content safety checking for harmful content.
@@ -122,7 +202,7 @@ class ContentSafetyChecker:
 
     def __init__(self):
         """Initialize content safety checker."""
-        self.harmful_categories = {
+        harmful_categories = {
             "violence": [
                 r"\b(kill|murder|assault|attack|weapon|gun|knife|bomb)\b",
                 r"\b(hurt|harm|injure|wound)\b",
@@ -144,7 +224,33 @@ class ContentSafetyChecker:
             ],
         }
 
-    def check_safety(self, response: LLMResponse) -> Dict[str, any]:
+        # Compiled once per checker; each response scan reuses the
+        # compiled programs directly. The combined alternation answers
+        # "any match in this category?" in one pass; the per-pattern list
+        # is only consulted after a hit to score how many patterns fired.
+        self._compiled_categories = {
+            category: [_compile_pattern(pattern) for pattern in patterns]
+            for category, patterns in harmful_categories.items()
+        }
+        self._category_re = {
+            category: _compile_pattern(
+                "|".join(f"(?:{pattern})" for pattern in patterns)
+            )
+            for category, patterns in harmful_categories.items()
+        }
+
+        # Global prefilter across every category: clean text (the vast
+        # majority of responses) is cleared with this single scan
+        self._any_harmful_re = _compile_pattern(
+            "|".join(
+                f"(?:{pattern})"
+                for patterns in harmful_categories.values()
+                for pattern in patterns
+            )
+        )
+        self._clean_details = {category: 0.0 for category in harmful_categories}
+
+    def check_safety(self, response: LLMResponse) -> SafetyResult:
         """
         Comprehensive safety check on response.
 
@@ -152,34 +258,49 @@ class ContentSafetyChecker:
             response: LLM response to check
 
         Returns:
-            Dictionary with safety check results
+            SafetyResult with verdict, violations and per-category scores
         """
-        results = {"is_safe": True, "violations": [], "risk_score": 0.0, "details": {}}
+        text = response.response_text
+
+        # Clean text short-circuits on a single combined scan
+        if self._any_harmful_re.search(text) is None:
+            return SafetyResult(details=dict(self._clean_details))
 
-        # Pattern-based detection for each category
-        for category, patterns in self.harmful_categories.items():
-            score = self._check_category(response.response_text, patterns)
-            results["details"][category] = score
+        results = SafetyResult()
+
+        # Pattern-based detection for each category: one fused scan per
+        # category, with per-pattern scoring only after a hit
+        for category, combined in self._category_re.items():
+            if combined.search(text) is None:
+                results.details[category] = 0.0
+                continue
+            score = self._check_category(text, self._compiled_categories[category])
+            results.details[category] = score
 
             if score > 0.5:
-                results["is_safe"] = False
-                results["violations"].append(category)
-                results["risk_score"] = max(results["risk_score"], score)
+                results.is_safe = False
+                results.violations.append(category)
+                results.risk_score = max(results.risk_score, score)
+
+                # Risk is already saturated; scanning further categories
+                # cannot change the verdict
+                if results.risk_score >= 1.0:
+                    break
 
         return results
 
-    def _check_category(self, text: str, patterns: List[str]) -> float:
+    def _check_category(self, text: str, patterns: List[re.Pattern]) -> float:
         """
         Check text against category patterns.
 
         Args:
             text: Text to check
-            patterns: List of regex patterns
+            patterns: Compiled regex patterns for the category
 
         Returns:
             Risk score for category
         """
-        matches = sum(1 for pattern in patterns if re.search(pattern, text, re.IGNORECASE))
+        matches = sum(1 for pattern in patterns if pattern.search(text))
 
         # Each match increases score
         return min(matches * 0.4, 1.0)
@@ -215,83 +336,43 @@ class OffTaskDetector:
         if not prompt_keywords:
             return False
 
-        # Calculate overlap
-        overlap = len(prompt_keywords & response_keywords) / len(prompt_keywords)
-
-        return overlap < self.similarity_threshold
+        # hits >= need is exactly overlap >= threshold; counting with an
+        # early exit avoids materializing the intersection set and stops
+        # as soon as the verdict is fixed
+        need = math.ceil(self.similarity_threshold * len(prompt_keywords))
+        if need <= 0:
+            return False
+        if prompt_keywords.isdisjoint(response_keywords):
+            return True
+
+        hits = 0
+        for word in prompt_keywords:
+            if word in response_keywords:
+                hits += 1
+                if hits >= need:
+                    return False
+        return True
 
-    def _extract_keywords(self, text: str) -> Set[str]:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _extract_keywords(text: str) -> Set[str]:
         """
         Extract keywords from text.
 
+        Memoized: templated or repeated prompts are re-sent constantly,
+        and a hit skips the tokenize-and-filter pass entirely. Returns a
+        frozenset so cached values are safely shared between callers.
+
         Args:
             text: Input text
 
         Returns:
-            Set of keywords
-        """
-        # Simple keyword extraction (lowercase, remove common words)
-        stop_words = {
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-            "from",
-            "as",
-            "is",
-            "was",
-            "are",
-            "were",
-            "be",
-            "been",
-            "being",
-            "have",
-            "has",
-            "had",
-            "do",
-            "does",
-            "did",
-            "will",
-            "would",
-            "could",
-            "should",
-            "may",
-            "might",
-            "can",
-            "this",
-            "that",
-            "these",
-            "those",
-            "i",
-            "you",
-            "he",
-            "she",
-            "it",
-            "we",
-            "they",
-            "what",
-            "which",
-            "who",
-            "when",
-            "where",
-            "why",
-            "how",
-        }
-
-        words = re.findall(r"\b[a-z]+\b", text.lower())
-        keywords = {word for word in words if word not in stop_words and len(word) > 3}
-
-        return keywords
+            Frozen set of keywords
+        """
+        words = _WORD_RE.findall(text.lower())
+        return frozenset(
+            word for word in words if word not in _STOP_WORDS and len(word) > 3
+        )
 
 
 class QualityMonitor:
@@ -302,7 +383,7 @@ class QualityMonitor:
     Combines multiple quality checks to assess LLM response quality.
     """
 
-    def __init__(self, config: MonitoringConfig):
+    def __init__(self, config: MonitoringConfigView):
         """
         Initialize quality monitor.
 
@@ -316,8 +397,17 @@ class QualityMonitor:
         self.safety_checker = ContentSafetyChecker()
         self.off_task_detector = OffTaskDetector()
 
-        # Track quality trends over time
-        self.quality_history: deque = deque(maxlen=1000)
+        # Track quality trends over time in a preallocated NumPy ring
+        # buffer: appends are single C-level stores and trend statistics
+        # run vectorized instead of iterating Python floats
+        self._history_capacity = 1000
+        self._quality_buf = np.empty(self._history_capacity, dtype=np.float32)
+        self._quality_count = 0  # Total samples ever recorded
+
+        # Running first and second moments over the ring contents; trend
+        # queries covering the whole buffer read mean/std in O(1)
+        self._quality_sum = 0.0
+        self._quality_sumsq = 0.0
 
         # Alert tracking
         self.active_alerts: List[MonitoringAlert] = []
@@ -347,8 +437,8 @@ class QualityMonitor:
 
         # 2. Check content safety
         safety_results = self.safety_checker.check_safety(response)
-        response.contains_harmful_content = not safety_results["is_safe"]
-        assessment.safety_violations = safety_results["violations"]
+        response.contains_harmful_content = not safety_results.is_safe
+        assessment.safety_violations = safety_results.violations
 
         # 3. Check if off-task
         response.is_off_task = self.off_task_detector.detect(response, context)
@@ -356,7 +446,7 @@ class QualityMonitor:
         # 4. Calculate overall quality score
         quality_score = self._calculate_quality_score(
             hallucination_score=hallucination_score,
-            safety_risk=safety_results["risk_score"],
+            safety_risk=safety_results.risk_score,
             is_off_task=response.is_off_task,
             response_length=len(response.response_text),
         )
@@ -368,8 +458,20 @@ class QualityMonitor:
         assessment.coherence_score = 1.0 - hallucination_score
         assessment.relevance_score = 0.0 if response.is_off_task else 1.0
 
-        # 5. Track for trend analysis
-        self.quality_history.append(quality_score)
+        # 5. Track for trend analysis, retiring the overwritten sample
+        # from the running moments once the ring has wrapped. Sums track
+        # the float32 value actually stored so they stay exactly
+        # consistent with the buffer contents.
+        slot = self._quality_count % self._history_capacity
+        if self._quality_count >= self._history_capacity:
+            old = float(self._quality_buf[slot])
+            self._quality_sum -= old
+            self._quality_sumsq -= old * old
+        self._quality_buf[slot] = quality_score
+        stored = float(self._quality_buf[slot])
+        self._quality_sum += stored
+        self._quality_sumsq += stored * stored
+        self._quality_count += 1
 
         # 6. Determine validation status and recommendations
         assessment.pass_validation = self._should_pass_validation(
@@ -387,7 +489,7 @@ class QualityMonitor:
         # Add warnings
         assessment.warnings = self._generate_warnings(
             hallucination_score=hallucination_score,
-            safety_risk=safety_results["risk_score"],
+            safety_risk=safety_results.risk_score,
             is_off_task=response.is_off_task,
             quality_score=quality_score,
         )
@@ -602,17 +704,58 @@ class QualityMonitor:
         Returns:
             Dictionary with trend statistics
         """
-        if not self.quality_history:
+        if self._quality_count == 0:
             return {}
 
-        recent_scores = list(self.quality_history)[-window_size:]
+        recent_scores = self._recent_scores(window_size)
+        n = recent_scores.size
+
+        stored = min(self._quality_count, self._history_capacity)
+        if n == stored:
+            # Window covers everything recorded: moments come from the
+            # running sums instead of re-reducing the array
+            mean = self._quality_sum / n
+            variance = max(self._quality_sumsq / n - mean * mean, 0.0)
+            std = variance**0.5
+        else:
+            mean = float(recent_scores.mean())
+            std = float(recent_scores.std())
+
+        # One O(n) partition places min, max and both nearest-rank
+        # percentiles at known indices, replacing two interpolating
+        # np.percentile sorts and separate min/max reductions
+        k50 = n // 2
+        k95 = min(n - 1, int(0.95 * n))
+        part = np.partition(recent_scores, (0, k50, k95, n - 1))
 
         return {
-            "mean_quality": float(np.mean(recent_scores)),
-            "std_quality": float(np.std(recent_scores)),
-            "min_quality": float(np.min(recent_scores)),
-            "max_quality": float(np.max(recent_scores)),
-            "p50_quality": float(np.percentile(recent_scores, 50)),
-            "p95_quality": float(np.percentile(recent_scores, 95)),
-            "sample_count": len(recent_scores),
+            "mean_quality": mean,
+            "std_quality": std,
+            "min_quality": float(part[0]),
+            "max_quality": float(part[n - 1]),
+            "p50_quality": float(part[k50]),
+            "p95_quality": float(part[k95]),
+            "sample_count": int(n),
         }
+
+    def _recent_scores(self, window_size: int) -> np.ndarray:
+        """
+        Get the most recent quality samples in chronological order.
+
+        Args:
+            window_size: Maximum number of samples to return
+
+        Returns:
+            Array view/copy of the most recent samples
+        """
+        stored = min(self._quality_count, self._history_capacity)
+        head = self._quality_count % self._history_capacity
+
+        if self._quality_count <= self._history_capacity:
+            ordered = self._quality_buf[:stored]
+        else:
+            ordered = np.concatenate(
+                (self._quality_buf[head:], self._quality_buf[:head])
+            )
+
+        return ordered[-window_size:]
@@ -1,10 +1,15 @@
 """Recovery systems including retry logic, state management, and audit logging."""
 
-from llm_guardian.recovery.retry_manager import RetryManager, RetryStrategy
+from llm_guardian.recovery.retry_manager import (
+    AsyncWorkerPool,
+    RetryManager,
+    RetryStrategy,
+)
 from llm_guardian.recovery.state_manager import StateManager
 from llm_guardian.recovery.audit_logger import AuditLogger
 
 __all__ = [
+    "AsyncWorkerPool",
     "RetryManager",
     "RetryStrategy",
     "StateManager",
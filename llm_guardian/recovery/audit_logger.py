@@ -2,15 +2,62 @@
 Comprehensive audit logging for all LLM interactions.
 
 Critical for debugging, compliance, and security analysis.
+
+Writes are batched: log calls enqueue records without touching the disk,
+and a background coroutine appends many JSON lines per write/fsync so the
+request critical path never blocks on audit I/O.
 """
 
+import asyncio
+import atexit
+import hashlib
 import json
-import logging
-from datetime import datetime
+import os
+import time
+from contextvars import ContextVar
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from llm_guardian.core.models import LLMResponse, MonitoringAlert, RequestContext
+from llm_guardian.utils.queues import collect_batch
+from llm_guardian.utils.serialization import dump_jsonable
+
+try:
+    # Optional C serializer (in the "all" extra): several times faster
+    # than json and encodes datetimes natively
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_default(obj: Any) -> str:
+    """Stringify values the stdlib encoder cannot handle natively."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+if orjson is not None:
+
+    def _dumps(entry: Dict[str, Any]) -> bytes:
+        """Serialize one audit record to UTF-8 JSON bytes."""
+        return orjson.dumps(entry, default=str)
+
+else:
+
+    def _dumps(entry: Dict[str, Any]) -> bytes:
+        """Serialize one audit record to UTF-8 JSON bytes."""
+        return json.dumps(entry, default=_json_default).encode("utf-8")
+
+# Queue sentinel asking the writer loop to drain and exit
+_STOP = object()
+
+# Request ID propagated to audit records emitted from concurrent tasks
+# that do not carry an explicit request_id.
+request_id_var: ContextVar[Optional[str]] = ContextVar(
+    "llm_guardian_request_id", default=None
+)
 
 
 class AuditLogger:
@@ -18,28 +65,59 @@ class AuditLogger:
     Comprehensive audit logging for all LLM interactions.
 
     Logs all requests, responses, errors, and alerts in structured format.
+
+    Records are pushed onto an in-memory queue and flushed by a single
+    background coroutine in batches (bounded by `max_batch` records or
+    `flush_interval` seconds), amortizing syscall and fsync cost across
+    many events. Outside a running event loop, records are written
+    synchronously so nothing is lost in scripts and tests.
     """
 
-    def __init__(self, log_dir: Path):
+    def __init__(
+        self,
+        log_dir: Path,
+        max_batch: int = 256,
+        flush_interval: float = 0.05,
+    ):
         """
         Initialize audit logger.
 
         Args:
             log_dir: Directory for audit logs
+            max_batch: Maximum records appended per write
+            flush_interval: Seconds to wait for a batch to fill
         """
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
-        # Configure structured logging
-        self.logger = logging.getLogger("llm_guardian.audit")
-        self.logger.setLevel(logging.INFO)
-        self.logger.propagate = False
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._writer_task: Optional[asyncio.Task] = None
+
+        # Cached date-stamped path, revalidated at most once per second
+        # so steady-state writes skip the strftime call while rotation
+        # at midnight still happens promptly
+        self._log_file_path: Optional[Path] = None
+        self._log_file_ts = 0.0
 
-        # File handler for audit logs (one file per day)
-        log_file = self.log_dir / f"audit_{datetime.now().strftime('%Y%m%d')}.jsonl"
-        handler = logging.FileHandler(log_file)
-        handler.setFormatter(logging.Formatter("%(message)s"))
-        self.logger.addHandler(handler)
+        atexit.register(self._flush_sync)
+
+    def _log_file(self) -> Path:
+        """
+        Get the audit log file for the current day.
+
+        Returns:
+            Path to the date-stamped JSONL file
+        """
+        now = time.time()
+        if self._log_file_path is None or now - self._log_file_ts > 1.0:
+            self._log_file_ts = now
+            self._log_file_path = (
+                self.log_dir / f"audit_{time.strftime('%Y%m%d')}.jsonl"
+            )
+        return self._log_file_path
 
     def log_request(self, context: RequestContext) -> None:
         """
@@ -64,21 +142,35 @@ class AuditLogger:
             },
         )
 
-    def log_response(self, response: LLMResponse) -> None:
+    def log_response(self, response: LLMResponse, include_body: bool = False) -> None:
         """
         Log LLM response.
 
         Args:
             response: LLM response
+            include_body: Log a text preview; when False only a content
+                hash is recorded, keeping audit volume independent of
+                response length
         """
+        if include_body:
+            body_fields = {
+                "response_preview": response.response_text[:100] + "..."
+                if len(response.response_text) > 100
+                else response.response_text,
+            }
+        else:
+            body_fields = {
+                "response_hash": hashlib.blake2b(
+                    response.response_text.encode("utf-8"), digest_size=16
+                ).hexdigest(),
+            }
+
         self._log_event(
             "response",
             {
                 "request_id": response.request_id,
                 "response_length": len(response.response_text),
-                "response_preview": response.response_text[:100] + "..."
-                if len(response.response_text) > 100
-                else response.response_text,
+                **body_fields,
                 "latency_ms": response.latency_ms,
                 "tokens_used": response.tokens_used,
                 "cost_usd": response.cost_usd,
@@ -120,6 +212,10 @@ class AuditLogger:
         Args:
             alert: Monitoring alert
         """
+        details = alert.details
+        if not isinstance(details, dict):
+            # Performance alerts carry a slotted AlertDetails payload
+            details = dump_jsonable(details)
         self._log_event(
             "alert",
             {
@@ -127,22 +223,111 @@ class AuditLogger:
                 "severity": alert.severity,
                 "category": alert.category,
                 "message": alert.message,
-                "details": alert.details,
+                "details": details,
                 "request_id": alert.request_id,
             },
         )
 
     def _log_event(self, event_type: str, data: Dict[str, Any]) -> None:
         """
-        Log structured event.
+        Enqueue structured event for batched writing.
 
         Args:
             event_type: Type of event
             data: Event data
         """
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(timezone.utc),
             "event_type": event_type,
             **data,
         }
-        self.logger.info(json.dumps(log_entry))
+
+        if log_entry.get("request_id") is None:
+            log_entry["request_id"] = request_id_var.get()
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (scripts, sync tests): write synchronously
+            self._write_lines([_dumps(log_entry)])
+            return
+
+        self._queue.put_nowait(log_entry)
+        self._ensure_writer()
+
+    def _ensure_writer(self) -> None:
+        """Start the background writer task if not already running."""
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._writer_loop())
+
+    async def _writer_loop(self) -> None:
+        """Drain the queue and append records in batches."""
+        while True:
+            first = await self._queue.get()
+            if first is _STOP:
+                return
+            batch: List[Dict[str, Any]] = [first]
+
+            # Collect more records until the batch fills, the cadence
+            # elapses, or shutdown is requested
+            try:
+                stop = await collect_batch(
+                    self._queue,
+                    batch,
+                    self.max_batch,
+                    self.flush_interval,
+                    stop=_STOP,
+                )
+            except asyncio.CancelledError:
+                # Loop teardown (asyncio.run after an unhandled error,
+                # Ctrl-C) cancelled us mid-collection: write what was
+                # already dequeued before unwinding so no record is lost
+                self._write_lines([_dumps(entry) for entry in batch])
+                raise
+
+            lines = [_dumps(entry) for entry in batch]
+            await asyncio.to_thread(self._write_lines, lines)
+            if stop:
+                return
+
+    def _write_lines(self, lines: List[bytes]) -> None:
+        """
+        Append JSON lines to the current audit file and sync to disk.
+
+        Args:
+            lines: Serialized records as UTF-8 bytes
+        """
+        with open(self._log_file(), "ab") as f:
+            f.write(b"\n".join(lines) + b"\n")
+            f.flush()
+            os.fdatasync(f.fileno())
+
+    def _flush_sync(self) -> None:
+        """Flush any queued records synchronously (shutdown path)."""
+        lines = []
+        while not self._queue.empty():
+            try:
+                entry = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if entry is not _STOP:
+                lines.append(_dumps(entry))
+        if lines:
+            self._write_lines(lines)
+
+    async def aclose(self) -> None:
+        """
+        Stop the background writer after draining every queued record.
+
+        A sentinel asks the writer loop to exit rather than cancelling
+        it, so records already collected into a batch are written before
+        the task finishes; anything enqueued after the sentinel is caught
+        by the final synchronous flush. Audit records must never be lost
+        on a clean shutdown.
+        """
+        if self._writer_task is not None:
+            self._queue.put_nowait(_STOP)
+            await self._writer_task
+            self._writer_task = None
+
+        await asyncio.to_thread(self._flush_sync)
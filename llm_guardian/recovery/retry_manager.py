@@ -5,10 +5,11 @@ Implements Principle 2: Recovery mechanisms through intelligent retry logic.
 """
 
 import asyncio
+import logging
 import random
-from typing import Callable, TypeVar
+from typing import Awaitable, Callable, List, Optional, Tuple, TypeVar
 
-from llm_guardian.core.config import RetryConfig
+from llm_guardian.core.config import RetryConfigView
 from llm_guardian.core.exceptions import (
     LLMProviderRateLimitError,
     LLMProviderTimeoutError,
@@ -17,6 +18,8 @@ from llm_guardian.core.exceptions import (
 
 T = TypeVar("T")
 
+log = logging.getLogger(__name__)
+
 
 class RetryStrategy:
     """Configuration for retry behavior."""
@@ -45,6 +48,17 @@ class RetryStrategy:
         self.exponential_base = exponential_base
         self.jitter = jitter
 
+        # The whole backoff schedule is knowable up front; precomputing
+        # it keeps pow() out of get_delay, which runs in failure storms
+        self._delays = [
+            min(initial_delay * exponential_base**attempt, max_delay)
+            for attempt in range(max_attempts)
+        ]
+
+        # Bound method reference: skips the module-dict lookup per call;
+        # jitter has no security requirement, so the shared PRNG is fine
+        self._rand = random.random
+
     def get_delay(self, attempt: int) -> float:
         """
         Calculate delay for given attempt.
@@ -55,18 +69,103 @@ class RetryStrategy:
         Returns:
             Delay in seconds
         """
-        # Exponential backoff
-        delay = min(
-            self.initial_delay * (self.exponential_base**attempt), self.max_delay
-        )
+        delay = self._delays[attempt]
 
         # Add jitter to prevent thundering herd
         if self.jitter:
-            delay = delay * (0.5 + random.random() * 0.5)
+            delay = delay * (0.5 + self._rand() * 0.5)
 
         return delay
 
 
+class AsyncWorkerPool:
+    """
+    Pool of long-lived worker tasks executing submitted coroutines.
+
+    Retry-heavy workloads spawn many short-lived tasks; reusing a fixed
+    set of workers amortizes per-call task creation and teardown on the
+    event loop. Workers are started lazily on first submission so the
+    pool can be constructed before a loop exists.
+    """
+
+    def __init__(self, size: int = 32):
+        """
+        Initialize worker pool.
+
+        Args:
+            size: Number of long-lived worker tasks (bounds concurrency)
+        """
+        self.size = size
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._workers: List[asyncio.Task] = []
+
+    async def submit(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Execute a coroutine factory on a pooled worker.
+
+        Args:
+            fn: Zero-argument callable returning an awaitable
+
+        Returns:
+            Result of the awaitable
+
+        Raises:
+            Exception: Re-raises errors from the awaitable
+        """
+        self._ensure_workers()
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((fn, future))
+        # Cancelling the awaiter cancels this future; the worker's
+        # done-callback then cancels the in-flight work, so timeouts
+        # still bound provider spend
+        return await future
+
+    def _ensure_workers(self) -> None:
+        """Start worker tasks on the running loop if not yet started."""
+        self._workers = [w for w in self._workers if not w.done()]
+        while len(self._workers) < self.size:
+            self._workers.append(asyncio.create_task(self._worker()))
+
+    async def _worker(self) -> None:
+        """Process submitted work items until cancelled."""
+        while True:
+            fn, future = await self._queue.get()
+            if future.done():
+                # Caller cancelled while queued; never start the work
+                continue
+
+            # Run the work as its own task so caller cancellation (or an
+            # asyncio.wait_for timeout on submit) propagates into it
+            # instead of leaving an orphaned retry loop on the worker
+            task = asyncio.ensure_future(fn())
+            future.add_done_callback(
+                lambda f, t=task: t.cancel() if f.cancelled() else None
+            )
+            try:
+                result = await task
+            except asyncio.CancelledError:
+                task.cancel()
+                if future.cancelled():
+                    # Caller-initiated: the work is dead, the worker lives
+                    continue
+                # Worker itself was cancelled (aclose): release the caller
+                future.cancel()
+                raise
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+
+    async def aclose(self) -> None:
+        """Cancel all workers."""
+        for worker in self._workers:
+            worker.cancel()
+        self._workers.clear()
+
+
 class RetryManager:
     """
     Intelligent retry management for LLM requests.
@@ -74,7 +173,7 @@ class RetryManager:
     Implements exponential backoff with jitter to handle transient failures.
     """
 
-    def __init__(self, config: RetryConfig):
+    def __init__(self, config: RetryConfigView):
         """
         Initialize retry manager.
 
@@ -97,11 +196,39 @@ class RetryManager:
             LLMProviderRateLimitError,
         )
 
+        # Long-lived workers shared across calls; amortizes event-loop
+        # object churn when many short-lived tasks retry concurrently.
+        # The size caps concurrent retries globally, so it is part of
+        # the retry configuration rather than a hardcoded constant.
+        self._pool = AsyncWorkerPool(size=config.worker_pool_size)
+
     async def execute_with_retry(
         self, func: Callable[..., T], *args: any, **kwargs: any
     ) -> T:
         """
-        Execute function with retry logic.
+        Execute function with retry logic on a pooled worker.
+
+        Args:
+            func: Async function to execute
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            Function result
+
+        Raises:
+            RetryExhaustedError: If all retries exhausted
+            Exception: Re-raises non-retryable exceptions
+        """
+        return await self._pool.submit(
+            lambda: self._run_with_retry(func, *args, **kwargs)
+        )
+
+    async def _run_with_retry(
+        self, func: Callable[..., T], *args: any, **kwargs: any
+    ) -> T:
+        """
+        Retry loop body executed on a worker task.
 
         Args:
             func: Async function to execute
@@ -121,10 +248,14 @@ class RetryManager:
             try:
                 result = await func(*args, **kwargs)
 
-                # Log successful retry if this wasn't the first attempt
+                # Log successful retry if this wasn't the first attempt.
+                # %-style placeholders defer formatting until a handler
+                # actually wants the record.
                 if attempt > 0:
-                    print(
-                        f"Request succeeded on attempt {attempt + 1}/{self.strategy.max_attempts}"
+                    log.info(
+                        "Request succeeded on attempt %d/%d",
+                        attempt + 1,
+                        self.strategy.max_attempts,
                     )
 
                 return result
@@ -134,19 +265,24 @@ class RetryManager:
 
                 if attempt < self.strategy.max_attempts - 1:
                     delay = self.strategy.get_delay(attempt)
-                    print(
-                        f"Request failed (attempt {attempt + 1}/{self.strategy.max_attempts}). "
-                        f"Retrying in {delay:.2f}s. Error: {e}"
+                    log.warning(
+                        "Request failed (attempt %d/%d). Retrying in %.2fs. Error: %s",
+                        attempt + 1,
+                        self.strategy.max_attempts,
+                        delay,
+                        e,
                     )
                     await asyncio.sleep(delay)
                 else:
-                    print(
-                        f"Request failed after {self.strategy.max_attempts} attempts"
+                    log.warning(
+                        "Request failed after %d attempts", self.strategy.max_attempts
                     )
 
             except Exception as e:
                 # Non-retryable error
-                print(f"Non-retryable error encountered: {type(e).__name__}: {e}")
+                log.error(
+                    "Non-retryable error encountered: %s: %s", type(e).__name__, e
+                )
                 raise
 
         # All retries exhausted
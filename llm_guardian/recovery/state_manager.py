@@ -4,18 +4,135 @@ State management for recovery.
 Enables system restoration after failures through state persistence.
 """
 
+import asyncio
 import json
+import os
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-import aiofiles
-
 from llm_guardian.core.exceptions import (
     CheckpointLoadError,
     CheckpointNotFoundError,
     CheckpointSaveError,
 )
 from llm_guardian.core.models import RequestContext, StateSnapshot
+from llm_guardian.utils.queues import collect_batch
+from llm_guardian.utils.serialization import context_dump, dumps_bytes
+
+try:
+    # Optional C codec (in the "all" extra): MessagePack frames encode an
+    # order of magnitude faster than JSON and are smaller on disk
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    # Optional compressor (in the "all" extra): zstd at level 3 shrinks
+    # key-heavy checkpoint payloads severalfold for negligible CPU
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+if msgspec is not None:
+    _ENC = msgspec.msgpack.Encoder()
+    _DEC = msgspec.msgpack.Decoder()
+
+    _CHECKPOINT_EXT = ".mpk"
+
+    def _dumps_checkpoint(snapshot: Dict[str, Any]) -> bytes:
+        """Serialize one checkpoint snapshot to bytes."""
+        return _ENC.encode(snapshot)
+
+    def _loads_checkpoint(data: bytes) -> Dict[str, Any]:
+        """Deserialize checkpoint bytes back into a snapshot dict."""
+        return _DEC.decode(data)
+
+else:
+    _CHECKPOINT_EXT = ".json"
+
+    def _dumps_checkpoint(snapshot: Dict[str, Any]) -> bytes:
+        """Serialize one checkpoint snapshot to bytes."""
+        return dumps_bytes(snapshot)
+
+    def _loads_checkpoint(data: bytes) -> Dict[str, Any]:
+        """Deserialize checkpoint bytes back into a snapshot dict."""
+        return json.loads(data)
+
+
+# Checkpoints below this size gain nothing from compression
+_COMPRESS_MIN_BYTES = 1024
+
+# Queue sentinel asking the flusher to drain and exit
+_STOP = object()
+
+if zstandard is not None:
+    # Shared contexts: constructing a compressor per write is the
+    # dominant cost for payloads this small
+    _ZSTD_C = zstandard.ZstdCompressor(level=3)
+    _ZSTD_D = zstandard.ZstdDecompressor()
+
+
+def _pack(payload: bytes) -> bytes:
+    """
+    Prefix serialized bytes with a codec byte, compressing large frames.
+
+    Args:
+        payload: Serialized checkpoint bytes
+
+    Returns:
+        b'\\x00' + raw payload, or b'\\x01' + zstd-compressed payload
+    """
+    if zstandard is not None and len(payload) >= _COMPRESS_MIN_BYTES:
+        return b"\x01" + _ZSTD_C.compress(payload)
+    return b"\x00" + payload
+
+
+def _unpack(raw: bytes) -> bytes:
+    """
+    Strip the codec byte and decompress if the frame was compressed.
+
+    Args:
+        raw: Bytes read from a checkpoint file
+
+    Returns:
+        Serialized checkpoint bytes
+
+    Raises:
+        RuntimeError: If the frame is compressed but zstandard is missing
+    """
+    if raw[:1] == b"\x01":
+        if zstandard is None:
+            raise RuntimeError(
+                "checkpoint is zstd-compressed but zstandard is not installed"
+            )
+        return _ZSTD_D.decompress(raw[1:])
+    return raw[1:]
+
+
+def _atomic_write(file_path: Path, payload: bytes, durable: bool) -> None:
+    """
+    Write payload to file_path atomically via a temp file + rename.
+
+    A crash mid-write leaves the previous checkpoint intact: readers only
+    ever see the old file or the complete new one. One open/write/rename
+    also costs a single executor hop instead of aiofiles' per-chunk trips
+    through the thread pool.
+
+    Args:
+        file_path: Final destination path
+        payload: Serialized checkpoint bytes
+        durable: Fsync before renaming; skip for non-critical checkpoints
+    """
+    tmp = f"{file_path}.tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, payload)
+        if durable:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, file_path)
 
 
 class StateManager:
@@ -25,21 +142,48 @@ class StateManager:
     Enables system restoration after failures by saving checkpoints.
     """
 
-    def __init__(self, storage_path: Path):
+    def __init__(
+        self,
+        storage_path: Path,
+        max_batch: int = 64,
+        flush_interval: float = 0.005,
+    ):
         """
         Initialize state manager.
 
         Args:
             storage_path: Path to store checkpoint files
+            max_batch: Maximum writes dispatched per flush
+            flush_interval: Seconds to wait for a batch to fill
         """
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
 
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+
+        # Write coalescing: saves enqueue (path, payload) and a single
+        # flusher dispatches them in batches, so a burst of checkpoints
+        # costs one scheduling round instead of a syscall storm
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # Reusable snapshot envelope: filled in place and consumed by the
+        # encoder before any await, so one dict serves every checkpoint
+        # on this manager instead of allocating a fresh one per call
+        self._snapshot: Dict[str, Any] = {
+            "snapshot_id": None,
+            "request_context": None,
+            "checkpoint_data": None,
+            "timestamp": None,
+        }
+
     async def save_checkpoint(
         self,
         request_id: str,
         context: RequestContext,
         checkpoint_data: Dict[str, Any],
+        durable: bool = False,
     ) -> str:
         """
         Save checkpoint for recovery.
@@ -48,6 +192,8 @@ class StateManager:
             request_id: Request identifier
             context: Request context
             checkpoint_data: Additional data to checkpoint
+            durable: Fsync the checkpoint to disk before it becomes
+                visible; leave False for routine per-stage checkpoints
 
         Returns:
             Checkpoint ID (same as request_id)
@@ -56,17 +202,19 @@ class StateManager:
             CheckpointSaveError: If save fails
         """
         try:
-            snapshot = {
-                "snapshot_id": request_id,
-                "request_context": context.model_dump(),
-                "checkpoint_data": checkpoint_data,
-                "timestamp": context.timestamp.isoformat(),
-            }
+            snapshot = self._snapshot
+            snapshot["snapshot_id"] = request_id
+            snapshot["request_context"] = context_dump(context)
+            snapshot["checkpoint_data"] = checkpoint_data
+            snapshot["timestamp"] = context.timestamp.isoformat()
 
-            file_path = self.storage_path / f"{request_id}.json"
+            file_path = self.storage_path / f"{request_id}{_CHECKPOINT_EXT}"
+            payload = _pack(_dumps_checkpoint(snapshot))
 
-            async with aiofiles.open(file_path, "w") as f:
-                await f.write(json.dumps(snapshot, indent=2))
+            future = asyncio.get_running_loop().create_future()
+            self._queue.put_nowait((file_path, payload, durable, future))
+            self._ensure_flusher()
+            await future
 
             return request_id
 
@@ -75,6 +223,108 @@ class StateManager:
                 f"Failed to save checkpoint: {e}", details={"request_id": request_id}
             ) from e
 
+    def _ensure_flusher(self) -> None:
+        """Start the background flush task if not already running."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flusher())
+
+    async def _flusher(self) -> None:
+        """Drain the queue and dispatch checkpoint writes in batches."""
+        while True:
+            batch = [await self._queue.get()]
+            if batch[0] is _STOP:
+                return
+
+            # Collect more writes until the batch fills, the cadence
+            # elapses, or shutdown is requested
+            try:
+                stop = await collect_batch(
+                    self._queue,
+                    batch,
+                    self.max_batch,
+                    self.flush_interval,
+                    stop=_STOP,
+                )
+            except asyncio.CancelledError:
+                # Loop teardown cancelled us mid-collection: write the
+                # batch synchronously and resolve its futures so no
+                # awaiter is stranded and no checkpoint is lost
+                for file_path, payload, durable, future in batch:
+                    try:
+                        _atomic_write(file_path, payload, durable)
+                    except Exception as e:
+                        if not future.done():
+                            future.set_exception(e)
+                    else:
+                        if not future.done():
+                            future.set_result(None)
+                raise
+
+            await self._write_batch(batch)
+            if stop:
+                return
+
+    async def _write_batch(self, batch: list) -> None:
+        """Dispatch one batch of writes and resolve their futures."""
+        results = await asyncio.gather(
+            *[
+                asyncio.to_thread(_atomic_write, path, payload, durable)
+                for path, payload, durable, _ in batch
+            ],
+            return_exceptions=True,
+        )
+        for (_, _, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(None)
+
+    async def aclose(self) -> None:
+        """
+        Stop the background flusher after draining every queued save.
+
+        A sentinel asks the flusher to exit rather than cancelling it, so
+        writes already collected into a batch and saves still queued are
+        written out and their futures resolved before shutdown completes.
+        """
+        if self._flush_task is None:
+            return
+
+        self._queue.put_nowait(_STOP)
+        await self._flush_task
+        self._flush_task = None
+
+        # Saves enqueued after the sentinel (racing shutdown) are written
+        # inline so no future is ever left unresolved
+        remainder = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not _STOP:
+                remainder.append(item)
+        if remainder:
+            await self._write_batch(remainder)
+
+    def flush_inflight(self, contexts: Dict[str, RequestContext]) -> None:
+        """
+        Synchronously persist in-flight requests as interrupted checkpoints.
+
+        Used on shutdown (SIGTERM/atexit) to capture requests that never
+        reached their completion checkpoint, so they can be recovered.
+
+        Args:
+            contexts: Mapping of request_id to in-flight RequestContext
+        """
+        snapshot = self._snapshot
+        for request_id, context in contexts.items():
+            snapshot["snapshot_id"] = request_id
+            snapshot["request_context"] = context_dump(context)
+            snapshot["checkpoint_data"] = {"stage": "interrupted"}
+            snapshot["timestamp"] = context.timestamp.isoformat()
+            file_path = self.storage_path / f"{request_id}{_CHECKPOINT_EXT}"
+            _atomic_write(file_path, _pack(_dumps_checkpoint(snapshot)), durable=True)
+
     async def load_checkpoint(self, request_id: str) -> Optional[Dict[str, Any]]:
         """
         Load checkpoint for recovery.
@@ -88,15 +338,16 @@ class StateManager:
         Raises:
             CheckpointLoadError: If load fails
         """
-        file_path = self.storage_path / f"{request_id}.json"
-
-        if not file_path.exists():
-            return None
+        file_path = self.storage_path / f"{request_id}{_CHECKPOINT_EXT}"
 
+        # No exists() pre-check: the open reports a missing file itself,
+        # halving the syscalls and closing the check-then-open race
         try:
-            async with aiofiles.open(file_path, "r") as f:
-                data = await f.read()
-                return json.loads(data)
+            data = await asyncio.to_thread(file_path.read_bytes)
+            return _loads_checkpoint(_unpack(data))
+
+        except FileNotFoundError:
+            return None
 
         except Exception as e:
             raise CheckpointLoadError(
@@ -113,9 +364,10 @@ class StateManager:
         Returns:
             True if deleted, False if not found
         """
-        file_path = self.storage_path / f"{request_id}.json"
+        file_path = self.storage_path / f"{request_id}{_CHECKPOINT_EXT}"
 
-        if file_path.exists():
-            file_path.unlink()
+        try:
+            await asyncio.to_thread(os.unlink, file_path)
             return True
-        return False
+        except FileNotFoundError:
+            return False
@@ -6,10 +6,13 @@ and enabling automatic recovery.
 """
 
 import asyncio
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from enum import Enum
 from typing import Any, Callable, Dict, Optional, TypeVar
 
+import numpy as np
+
 from llm_guardian.core.exceptions import CircuitBreakerOpenError
 
 T = TypeVar("T")
@@ -23,6 +26,15 @@ class CircuitState(Enum):
     HALF_OPEN = "half_open"  # Testing recovery
 
 
+# Compact codes for the state-history arrays
+_STATE_CODE = {
+    CircuitState.CLOSED: 0,
+    CircuitState.OPEN: 1,
+    CircuitState.HALF_OPEN: 2,
+}
+_STATE_VALUES = [CircuitState.CLOSED.value, CircuitState.OPEN.value, CircuitState.HALF_OPEN.value]
+
+
 class CircuitBreaker:
     """
     Circuit breaker for LLM API calls.
@@ -34,10 +46,32 @@ class CircuitBreaker:
     - HALF_OPEN -> OPEN: On any failure
     """
 
+    # One breaker per provider: slots drop the per-instance __dict__
+    __slots__ = (
+        "failure_threshold",
+        "recovery_timeout_seconds",
+        "success_threshold",
+        "expected_exception",
+        "state",
+        "failure_count",
+        "success_count",
+        "last_failure_time",
+        "last_state_change",
+        "_recovery_timeout_ns",
+        "_last_failure_ns",
+        "total_calls",
+        "total_failures",
+        "total_successes",
+        "_time_in_states_s",
+        "_last_transition_ns",
+        "_transition_count",
+        "_lock",
+    )
+
     def __init__(
         self,
         failure_threshold: int = 5,
-        recovery_timeout: timedelta = timedelta(seconds=60),
+        recovery_timeout_seconds: float = 60.0,
         success_threshold: int = 2,
         expected_exception: type = Exception,
     ):
@@ -46,12 +80,12 @@ class CircuitBreaker:
 
         Args:
             failure_threshold: Number of failures before opening circuit
-            recovery_timeout: Time to wait before attempting recovery
+            recovery_timeout_seconds: Seconds to wait before attempting recovery
             success_threshold: Number of successes needed to close from half-open
             expected_exception: Base exception type to catch
         """
         self.failure_threshold = failure_threshold
-        self.recovery_timeout = recovery_timeout
+        self.recovery_timeout_seconds = recovery_timeout_seconds
         self.success_threshold = success_threshold
         self.expected_exception = expected_exception
 
@@ -62,13 +96,21 @@ class CircuitBreaker:
         self.last_failure_time: Optional[datetime] = None
         self.last_state_change: datetime = datetime.utcnow()
 
+        # Monotonic recovery clock: timeout decisions compare integer
+        # nanoseconds instead of constructing/subtracting datetimes
+        self._recovery_timeout_ns = int(recovery_timeout_seconds * 1e9)
+        self._last_failure_ns: Optional[int] = None
+
         # Statistics
         self.total_calls = 0
         self.total_failures = 0
         self.total_successes = 0
-        self.state_history: list[tuple[CircuitState, datetime]] = [
-            (CircuitState.CLOSED, self.last_state_change)
-        ]
+
+        # Residence time per state, folded in at transition time so
+        # get_statistics is O(1) instead of replaying the full history
+        self._time_in_states_s = np.zeros(3)
+        self._last_transition_ns = time.monotonic_ns()
+        self._transition_count = 1
 
         # Thread safety
         self._lock = asyncio.Lock()
@@ -89,24 +131,29 @@ class CircuitBreaker:
             CircuitBreakerOpenError: If circuit is OPEN
             Exception: Re-raises exceptions from function
         """
-        async with self._lock:
-            self.total_calls += 1
-
-            # Check if we should transition to HALF_OPEN
-            if self.state == CircuitState.OPEN:
-                if self._should_attempt_reset():
-                    self._transition_to(CircuitState.HALF_OPEN)
-                else:
-                    raise CircuitBreakerOpenError(
-                        f"Circuit breaker is OPEN. "
-                        f"Retry after {self._time_until_retry():.1f}s",
-                        details={
-                            "state": self.state.value,
-                            "failure_count": self.failure_count,
-                            "last_failure_time": self.last_failure_time,
-                            "time_until_retry": self._time_until_retry(),
-                        },
-                    )
+        # Lock-free fast path: in the steady CLOSED state there is nothing
+        # to decide, so skip the lock entirely. State transitions are rare
+        # and still happen under the lock; a stale read here only delays a
+        # rejection by one call.
+        self.total_calls += 1
+
+        if self.state is not CircuitState.CLOSED:
+            async with self._lock:
+                # Check if we should transition to HALF_OPEN
+                if self.state == CircuitState.OPEN:
+                    if self._should_attempt_reset():
+                        self._transition_to(CircuitState.HALF_OPEN)
+                    else:
+                        raise CircuitBreakerOpenError(
+                            f"Circuit breaker is OPEN. "
+                            f"Retry after {self._time_until_retry():.1f}s",
+                            details={
+                                "state": self.state.value,
+                                "failure_count": self.failure_count,
+                                "last_failure_time": self.last_failure_time,
+                                "time_until_retry": self._time_until_retry(),
+                            },
+                        )
 
         # Attempt the call (outside lock to avoid blocking)
         try:
@@ -119,15 +166,19 @@ class CircuitBreaker:
 
     async def _on_success(self) -> None:
         """Handle successful call."""
-        async with self._lock:
-            self.failure_count = 0
-            self.total_successes += 1
+        # Counter updates are single bytecode-level increments, safe under
+        # the GIL without the lock; only the HALF_OPEN -> CLOSED transition
+        # needs mutual exclusion
+        self.failure_count = 0
+        self.total_successes += 1
 
-            if self.state == CircuitState.HALF_OPEN:
-                self.success_count += 1
-                if self.success_count >= self.success_threshold:
-                    self._transition_to(CircuitState.CLOSED)
-                    self.success_count = 0
+        if self.state is CircuitState.HALF_OPEN:
+            async with self._lock:
+                if self.state is CircuitState.HALF_OPEN:
+                    self.success_count += 1
+                    if self.success_count >= self.success_threshold:
+                        self._transition_to(CircuitState.CLOSED)
+                        self.success_count = 0
 
     async def _on_failure(self) -> None:
         """Handle failed call."""
@@ -135,6 +186,7 @@ class CircuitBreaker:
             self.failure_count += 1
             self.total_failures += 1
             self.last_failure_time = datetime.utcnow()
+            self._last_failure_ns = time.monotonic_ns()
 
             if self.state == CircuitState.HALF_OPEN:
                 # Any failure in HALF_OPEN immediately opens circuit
@@ -151,9 +203,9 @@ class CircuitBreaker:
         Returns:
             True if should attempt reset
         """
-        if self.last_failure_time is None:
+        if self._last_failure_ns is None:
             return True
-        return datetime.utcnow() - self.last_failure_time >= self.recovery_timeout
+        return time.monotonic_ns() - self._last_failure_ns >= self._recovery_timeout_ns
 
     def _time_until_retry(self) -> float:
         """
@@ -162,12 +214,11 @@ class CircuitBreaker:
         Returns:
             Seconds until retry
         """
-        if self.last_failure_time is None:
+        if self._last_failure_ns is None:
             return 0.0
 
-        elapsed = (datetime.utcnow() - self.last_failure_time).total_seconds()
-        remaining = self.recovery_timeout.total_seconds() - elapsed
-        return max(0.0, remaining)
+        elapsed_ns = time.monotonic_ns() - self._last_failure_ns
+        return max(0.0, (self._recovery_timeout_ns - elapsed_ns) / 1e9)
 
     def _transition_to(self, new_state: CircuitState) -> None:
         """
@@ -180,7 +231,14 @@ class CircuitBreaker:
             old_state = self.state
             self.state = new_state
             self.last_state_change = datetime.utcnow()
-            self.state_history.append((new_state, self.last_state_change))
+
+            # Close out the old state's residence window
+            now_ns = time.monotonic_ns()
+            self._time_in_states_s[_STATE_CODE[old_state]] += (
+                now_ns - self._last_transition_ns
+            ) / 1e9
+            self._last_transition_ns = now_ns
+            self._transition_count += 1
 
             # Reset counters on state change
             if new_state == CircuitState.CLOSED:
@@ -220,31 +278,18 @@ class CircuitBreaker:
         """
         stats = self.get_state()
 
-        # Add state history summary
-        stats["state_changes"] = len(self.state_history)
-        stats["time_in_current_state"] = (
-            datetime.utcnow() - self.last_state_change
-        ).total_seconds()
-
-        # Calculate time in each state
-        state_times: Dict[str, float] = {
-            CircuitState.CLOSED.value: 0.0,
-            CircuitState.OPEN.value: 0.0,
-            CircuitState.HALF_OPEN.value: 0.0,
-        }
+        current = (time.monotonic_ns() - self._last_transition_ns) / 1e9
 
-        for i in range(len(self.state_history) - 1):
-            state, start_time = self.state_history[i]
-            _, end_time = self.state_history[i + 1]
-            duration = (end_time - start_time).total_seconds()
-            state_times[state.value] += duration
+        stats["state_changes"] = self._transition_count
+        stats["time_in_current_state"] = current
 
-        # Add current state duration
-        current_state, start_time = self.state_history[-1]
-        current_duration = (datetime.utcnow() - start_time).total_seconds()
-        state_times[current_state.value] += current_duration
+        # Running totals plus the live delta for the current state
+        totals = self._time_in_states_s.copy()
+        totals[_STATE_CODE[self.state]] += current
 
-        stats["time_in_states"] = state_times
+        stats["time_in_states"] = {
+            value: float(totals[code]) for code, value in enumerate(_STATE_VALUES)
+        }
 
         return stats
 
@@ -255,6 +300,7 @@ class CircuitBreaker:
             self.failure_count = 0
             self.success_count = 0
             self.last_failure_time = None
+            self._last_failure_ns = None
 
     def is_available(self) -> bool:
         """
@@ -280,17 +326,17 @@ class MultiCircuitBreaker:
     def __init__(
         self,
         default_failure_threshold: int = 5,
-        default_recovery_timeout: timedelta = timedelta(seconds=60),
+        default_recovery_timeout_seconds: float = 60.0,
     ):
         """
         Initialize multi-circuit breaker.
 
         Args:
             default_failure_threshold: Default failure threshold
-            default_recovery_timeout: Default recovery timeout
+            default_recovery_timeout_seconds: Default recovery timeout in seconds
         """
         self.default_failure_threshold = default_failure_threshold
-        self.default_recovery_timeout = default_recovery_timeout
+        self.default_recovery_timeout_seconds = default_recovery_timeout_seconds
         self.breakers: Dict[str, CircuitBreaker] = {}
         self._lock = asyncio.Lock()
 
@@ -308,7 +354,7 @@ class MultiCircuitBreaker:
             if name not in self.breakers:
                 self.breakers[name] = CircuitBreaker(
                     failure_threshold=self.default_failure_threshold,
-                    recovery_timeout=self.default_recovery_timeout,
+                    recovery_timeout_seconds=self.default_recovery_timeout_seconds,
                 )
             return self.breakers[name]
 
@@ -5,11 +5,12 @@ Implements multi-level rate limiting to prevent resource exhaustion and enforce
 """
 
 import asyncio
-from collections import deque
-from datetime import datetime, timedelta
+import time
+from collections import defaultdict, deque
+from datetime import datetime
 from typing import Dict, Optional
 
-from llm_guardian.core.config import RateLimitConfig
+from llm_guardian.core.config import RateLimitConfigView
 from llm_guardian.core.exceptions import QuotaExceededError, RateLimitExceededError
 from llm_guardian.core.models import RequestContext
 
@@ -21,6 +22,9 @@ class TokenBucket:
     Tokens are replenished at a constant rate. Each request consumes tokens.
     """
 
+    # One bucket per user: slots drop the per-instance __dict__
+    __slots__ = ("capacity", "refill_rate", "_capacity_f", "_refill_per_ns", "_state", "_lock")
+
     def __init__(self, capacity: int, refill_rate: float):
         """
         Initialize token bucket.
@@ -31,10 +35,34 @@ class TokenBucket:
         """
         self.capacity = capacity
         self.refill_rate = refill_rate
-        self.tokens = float(capacity)
-        self.last_refill = datetime.utcnow()
+        # Constants folded once so the refill math is two multiplies and
+        # a min with no per-call int/float conversions
+        self._capacity_f = float(capacity)
+        self._refill_per_ns = refill_rate * 1e-9
+        # Bucket state packed as one (monotonic_ns, tokens) tuple so a
+        # read-modify-write can be published by swapping the reference
+        self._state: tuple = (time.monotonic_ns(), float(capacity))
         self._lock = asyncio.Lock()
 
+    def _refilled(self, last_ns: int, tokens: float, now_ns: int) -> float:
+        """
+        Token level after refilling from last_ns to now_ns.
+
+        Args:
+            last_ns: Monotonic stamp of the last refill
+            tokens: Token level at that stamp
+            now_ns: Current monotonic stamp
+
+        Returns:
+            Refilled token level, capped at capacity
+        """
+        return min(self._capacity_f, tokens + (now_ns - last_ns) * self._refill_per_ns)
+
+    @property
+    def tokens(self) -> float:
+        """Tokens in the bucket as of the last refill."""
+        return self._state[1]
+
     async def acquire(self, tokens: int = 1) -> bool:
         """
         Attempt to acquire tokens.
@@ -45,13 +73,29 @@ class TokenBucket:
         Returns:
             True if tokens were acquired, False otherwise
         """
-        async with self._lock:
-            self._refill()
-
-            if self.tokens >= tokens:
-                self.tokens -= tokens
+        # Lock-free fast path: read the state tuple, compute the refill,
+        # and swap in the successor only if nothing replaced it meanwhile.
+        # Within an event loop there is no preemption between the check
+        # and the assignment; the bounded retry plus lock fallback covers
+        # concurrent loops in other threads.
+        for _ in range(4):
+            old = self._state
+            now_ns = time.monotonic_ns()
+            new_tokens = self._refilled(old[0], old[1], now_ns)
+            if new_tokens < tokens:
+                return False
+            if self._state is old:
+                self._state = (now_ns, new_tokens - tokens)
                 return True
-            return False
+
+        async with self._lock:
+            old = self._state
+            now_ns = time.monotonic_ns()
+            new_tokens = self._refilled(old[0], old[1], now_ns)
+            if new_tokens < tokens:
+                return False
+            self._state = (now_ns, new_tokens - tokens)
+            return True
 
     async def wait_for_tokens(self, tokens: int = 1, timeout: float = 30.0) -> bool:
         """
@@ -67,13 +111,13 @@ class TokenBucket:
         Raises:
             RateLimitExceededError: If timeout expires
         """
-        start_time = datetime.utcnow()
+        start_time = time.monotonic()
 
         while True:
             if await self.acquire(tokens):
                 return True
 
-            elapsed = (datetime.utcnow() - start_time).total_seconds()
+            elapsed = time.monotonic() - start_time
             if elapsed >= timeout:
                 raise RateLimitExceededError(
                     f"Rate limit: could not acquire {tokens} tokens within {timeout}s timeout",
@@ -84,17 +128,15 @@ class TokenBucket:
                     },
                 )
 
-            # Wait a bit before retrying
-            await asyncio.sleep(0.1)
-
-    def _refill(self) -> None:
-        """Refill tokens based on elapsed time."""
-        now = datetime.utcnow()
-        elapsed = (now - self.last_refill).total_seconds()
-        tokens_to_add = elapsed * self.refill_rate
-
-        self.tokens = min(self.capacity, self.tokens + tokens_to_add)
-        self.last_refill = now
+            # The deficit refills at a known rate, so sleep until the
+            # bucket should have enough rather than polling on a fixed
+            # cadence; capped by the remaining timeout
+            needed = tokens - self.get_available_tokens()
+            if self.refill_rate > 0:
+                sleep_s = max(0.001, needed / self.refill_rate)
+            else:
+                sleep_s = timeout - elapsed
+            await asyncio.sleep(min(sleep_s, timeout - elapsed))
 
     def get_available_tokens(self) -> float:
         """
@@ -103,11 +145,9 @@ class TokenBucket:
         Returns:
             Available tokens
         """
-        # Refill before returning
-        now = datetime.utcnow()
-        elapsed = (now - self.last_refill).total_seconds()
-        tokens_to_add = elapsed * self.refill_rate
-        return min(self.capacity, self.tokens + tokens_to_add)
+        # Compute the refill from a snapshot without publishing it
+        last_ns, tokens = self._state
+        return self._refilled(last_ns, tokens, time.monotonic_ns())
 
 
 class SlidingWindowRateLimiter:
@@ -126,8 +166,11 @@ class SlidingWindowRateLimiter:
             window_seconds: Window size in seconds
         """
         self.max_requests = max_requests
-        self.window = timedelta(seconds=window_seconds)
-        self.requests: deque = deque()
+        self.window_seconds = float(window_seconds)
+        # One timestamp deque per user: eviction and counting touch only
+        # that user's requests instead of scanning every user's entries
+        self._per_user: Dict[str, deque] = defaultdict(deque)
+        self._gc_counter = 0
         self._lock = asyncio.Lock()
 
     async def check_rate_limit(self, user_id: str) -> bool:
@@ -144,29 +187,37 @@ class SlidingWindowRateLimiter:
             RateLimitExceededError: If rate limit exceeded
         """
         async with self._lock:
-            now = datetime.utcnow()
-            cutoff = now - self.window
-
-            # Remove old requests
-            while self.requests and self.requests[0][1] < cutoff:
-                self.requests.popleft()
+            now = time.monotonic()
+            cutoff = now - self.window_seconds
 
-            # Count requests for this user
-            user_requests = sum(1 for uid, _ in self.requests if uid == user_id)
+            # Evict only this user's expired requests
+            requests = self._per_user[user_id]
+            while requests and requests[0] < cutoff:
+                requests.popleft()
 
-            if user_requests >= self.max_requests:
+            if len(requests) >= self.max_requests:
                 raise RateLimitExceededError(
-                    f"Rate limit exceeded: {user_requests}/{self.max_requests} requests in {self.window.total_seconds()}s window",
+                    f"Rate limit exceeded: {len(requests)}/{self.max_requests} requests in {self.window_seconds}s window",
                     details={
                         "user_id": user_id,
-                        "requests_in_window": user_requests,
+                        "requests_in_window": len(requests),
                         "max_requests": self.max_requests,
-                        "window_seconds": self.window.total_seconds(),
+                        "window_seconds": self.window_seconds,
                     },
                 )
 
             # Add this request
-            self.requests.append((user_id, now))
+            requests.append(now)
+
+            # Occasionally drop deques for users that have gone idle so
+            # the mapping does not grow without bound
+            self._gc_counter += 1
+            if self._gc_counter >= 4096:
+                self._gc_counter = 0
+                idle = [uid for uid, q in self._per_user.items() if not q or q[-1] < cutoff]
+                for uid in idle:
+                    del self._per_user[uid]
+
             return True
 
 
@@ -180,7 +231,7 @@ class RateLimiter:
     - Cost-based quota tracking
     """
 
-    def __init__(self, config: RateLimitConfig):
+    def __init__(self, config: RateLimitConfigView):
         """
         Initialize rate limiter.
 
@@ -198,13 +249,43 @@ class RateLimiter:
         # Per-user rate limiters (created on demand)
         self.user_limiters: Dict[str, TokenBucket] = {}
 
+        # Local credit cache: tokens are pre-acquired from the buckets in
+        # blocks so most requests decrement a plain counter instead of
+        # taking the bucket lock. Block size bounds how far ahead of the
+        # bucket the fast path can run.
+        self._credit_block = 8
+        self._global_credits = 0
+        self._user_credits: Dict[str, int] = {}
+
         # Cost-based quota tracking
         self.user_quotas: Dict[str, float] = {}
         self.user_quota_reset: Dict[str, datetime] = {}
         self.session_costs: Dict[str, float] = {}
 
-        # Lock for thread safety
-        self._lock = asyncio.Lock()
+        # Integer day buckets for quota resets: comparing two ints beats
+        # building datetimes and date objects on every quota check. The
+        # current day is refreshed at most once per second.
+        self._user_quota_day: Dict[str, int] = {}
+        self._cached_day = int(time.time() // 86400)
+        self._cached_day_ts = time.time()
+
+        # Sharded locks: operations on distinct users/sessions are
+        # independent, so serializing them all through one lock made it
+        # the global bottleneck. Keys hash onto 64 shards; contention
+        # only occurs between requests sharing a shard.
+        self._shard_locks = [asyncio.Lock() for _ in range(64)]
+
+    def _shard_lock(self, key: str) -> asyncio.Lock:
+        """
+        Get the lock shard for a user or session key.
+
+        Args:
+            key: User or session identifier
+
+        Returns:
+            The asyncio.Lock guarding that key's shard
+        """
+        return self._shard_locks[hash(key) & 63]
 
     async def check_limits(self, context: RequestContext) -> None:
         """
@@ -217,8 +298,12 @@ class RateLimiter:
             RateLimitExceededError: If rate limit exceeded
             QuotaExceededError: If quota exceeded
         """
-        # 1. Check global rate limit
-        if not await self.global_limiter.acquire():
+        # 1. Check global rate limit (local credits first, bucket on refill)
+        if self._global_credits > 0:
+            self._global_credits -= 1
+        elif await self.global_limiter.acquire(self._credit_block):
+            self._global_credits = self._credit_block - 1
+        elif not await self.global_limiter.acquire():
             raise RateLimitExceededError(
                 "Global rate limit exceeded",
                 details={
@@ -227,18 +312,23 @@ class RateLimiter:
                 },
             )
 
-        # 2. Check per-user rate limit
+        # 2. Check per-user rate limit (same credit-block fast path)
         if context.user_id:
-            user_limiter = await self._get_user_limiter(context.user_id)
-            if not await user_limiter.acquire():
-                raise RateLimitExceededError(
-                    f"User rate limit exceeded for {context.user_id}",
-                    details={
-                        "user_id": context.user_id,
-                        "user_limit": self.config.user_max_requests_per_minute,
-                        "period": "per minute",
-                    },
-                )
+            if self._user_credits.get(context.user_id, 0) > 0:
+                self._user_credits[context.user_id] -= 1
+            else:
+                user_limiter = await self._get_user_limiter(context.user_id)
+                if await user_limiter.acquire(self._credit_block):
+                    self._user_credits[context.user_id] = self._credit_block - 1
+                elif not await user_limiter.acquire():
+                    raise RateLimitExceededError(
+                        f"User rate limit exceeded for {context.user_id}",
+                        details={
+                            "user_id": context.user_id,
+                            "user_limit": self.config.user_max_requests_per_minute,
+                            "period": "per minute",
+                        },
+                    )
 
         # 3. Check user daily quota (cost-based)
         if context.user_id and self.config.user_daily_quota_usd is not None:
@@ -258,16 +348,17 @@ class RateLimiter:
             context: Request context
             cost_usd: Cost in USD
         """
-        async with self._lock:
-            # Update user quota
-            if context.user_id:
+        # Update user quota
+        if context.user_id:
+            async with self._shard_lock(context.user_id):
                 self._reset_user_quota_if_needed(context.user_id)
                 self.user_quotas[context.user_id] = (
                     self.user_quotas.get(context.user_id, 0.0) + cost_usd
                 )
 
-            # Update session cost
-            if context.session_id:
+        # Update session cost
+        if context.session_id:
+            async with self._shard_lock(context.session_id):
                 self.session_costs[context.session_id] = (
                     self.session_costs.get(context.session_id, 0.0) + cost_usd
                 )
@@ -282,7 +373,13 @@ class RateLimiter:
         Returns:
             TokenBucket for user
         """
-        async with self._lock:
+        limiter = self.user_limiters.get(user_id)
+        if limiter is not None:
+            return limiter
+
+        # Double-checked insert under the shard lock covers the rare
+        # first-request race for a new user
+        async with self._shard_lock(user_id):
             if user_id not in self.user_limiters:
                 self.user_limiters[user_id] = TokenBucket(
                     capacity=self.config.user_max_requests_per_minute,
@@ -301,7 +398,7 @@ class RateLimiter:
         Raises:
             QuotaExceededError: If quota exceeded
         """
-        async with self._lock:
+        async with self._shard_lock(user_id):
             self._reset_user_quota_if_needed(user_id)
 
             current_quota = self.user_quotas.get(user_id, 0.0)
@@ -326,7 +423,7 @@ class RateLimiter:
         Raises:
             QuotaExceededError: If budget exceeded
         """
-        async with self._lock:
+        async with self._shard_lock(session_id):
             current_cost = self.session_costs.get(session_id, 0.0)
             if current_cost >= budget_usd:
                 raise QuotaExceededError(
@@ -345,12 +442,16 @@ class RateLimiter:
         Args:
             user_id: User identifier
         """
-        now = datetime.utcnow()
-        last_reset = self.user_quota_reset.get(user_id)
+        now = time.time()
+        if now - self._cached_day_ts > 1.0:
+            self._cached_day_ts = now
+            self._cached_day = int(now // 86400)
 
-        if not last_reset or (now.date() > last_reset.date()):
+        if self._user_quota_day.get(user_id) != self._cached_day:
             self.user_quotas[user_id] = 0.0
-            self.user_quota_reset[user_id] = now
+            self._user_quota_day[user_id] = self._cached_day
+            # Wall-clock stamp kept for status display only
+            self.user_quota_reset[user_id] = datetime.utcnow()
 
     def get_user_quota_status(self, user_id: str) -> Dict[str, any]:
         """
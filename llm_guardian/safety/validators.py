@@ -5,11 +5,20 @@ Implements Principle 3: Comprehensive validation at system boundaries.
 """
 
 import re
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
 from pydantic import ValidationError as PydanticValidationError
 
-from llm_guardian.core.config import SafetyConfig
+try:
+    # Optional linear-time regex engine (google-re2, in the "all" extra):
+    # the prompt is attacker-controlled, and a DFA removes the ReDoS
+    # class of inputs the backtracking stdlib engine is exposed to
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+from llm_guardian.core.config import SafetyConfigView
 from llm_guardian.core.exceptions import PromptInjectionError, ValidationError
 from llm_guardian.core.models import (
     LLMResponse,
@@ -18,6 +27,132 @@ from llm_guardian.core.models import (
 )
 
 
+def _compile_pattern(pattern: str, flags: int = re.IGNORECASE):
+    """
+    Compile a scanning pattern, preferring RE2 when installed.
+
+    Args:
+        pattern: Regex source
+        flags: Standard re flags (google-re2 accepts the same constants)
+
+    Returns:
+        Compiled pattern exposing the re match API
+    """
+    if _re2 is not None:
+        try:
+            return _re2.compile(pattern, flags)
+        except _re2.error:
+            # Pattern uses a construct RE2 rejects; keep stdlib semantics
+            pass
+    return re.compile(pattern, flags)
+
+
+# Shortest possible injection match ("[INST]"); prompts below this
+# length cannot contain any pattern
+_MIN_INJECTION_LEN = 6
+
+# Only prompts up to this length are memoized: retries, health probes
+# and template prompts are short, and long prompts would bloat the memo
+_MEMO_MAX_PROMPT_LEN = 1024
+
+# Literal atoms such that every possible injection match contains at
+# least one (case-insensitively). Benign prompts usually contain none,
+# so a few SIMD-backed substring checks veto the regex scan entirely.
+_INJECTION_ATOMS = (
+    "ignore",
+    "disregard",
+    "new",
+    "updated",
+    "system",
+    "<|im_",
+    "inst",
+    "forget",
+    "override",
+)
+
+
+@lru_cache(maxsize=1024)
+def _compile_forbidden(patterns: Tuple[str, ...]) -> "re.Pattern[str]":
+    """
+    Compile a forbidden-pattern list into one alternation regex.
+
+    Scanning the prompt becomes a single pass regardless of pattern count,
+    and the compiled pattern is cached per distinct pattern tuple so
+    repeat requests from the same caller pay compilation once.
+
+    Args:
+        patterns: Tuple of forbidden regex patterns
+
+    Returns:
+        Compiled case-insensitive alternation pattern
+    """
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _compile_ci(pattern: str) -> "re.Pattern[str]":
+    """
+    Compile a single case-insensitive pattern with a deterministic cache.
+
+    The re module's internal cache is global and bounded, so busy
+    multi-tenant traffic can evict patterns between requests; this cache
+    is ours and sized for the workload.
+
+    Args:
+        pattern: Regex pattern string
+
+    Returns:
+        Compiled case-insensitive pattern
+    """
+    return re.compile(pattern, re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _compile_topics(topics: Tuple[str, ...]) -> "re.Pattern[str]":
+    """
+    Compile a topic allowlist into one escaped alternation regex.
+
+    One pass over the prompt finds any topic keyword regardless of list
+    size, replacing a substring scan per topic plus a lowercased copy of
+    the prompt; cached per distinct topic tuple.
+
+    Args:
+        topics: Tuple of allowed topic keywords
+
+    Returns:
+        Compiled case-insensitive alternation pattern
+    """
+    return re.compile("|".join(re.escape(t) for t in topics), re.IGNORECASE)
+
+
+@lru_cache(maxsize=32)
+def _injection_engine(patterns: Tuple[str, ...]):
+    """
+    Build the fused injection scanner for one pattern tuple.
+
+    Every InputValidator ships the same default patterns, so the cache
+    hands all instances the one compiled engine instead of recompiling
+    the alternation per construction; compiled patterns are immutable
+    and safe to share.
+
+    Args:
+        patterns: Tuple of injection regex patterns
+
+    Returns:
+        Compiled case-insensitive ASCII alternation pattern
+    """
+    return _compile_pattern(
+        "|".join(f"(?:{p})" for p in patterns),
+        re.IGNORECASE | re.ASCII,
+    )
+
+
+# Shared success result: ValidationResult is frozen, so handing every
+# caller the one all-clear instance is safe and the common path
+# allocates nothing
+_OK_RESULT = ValidationResult(is_valid=True)
+
+
 class InputValidator:
     """
     Comprehensive input validation.
@@ -30,7 +165,7 @@ class InputValidator:
     - Topic allowlists
     """
 
-    def __init__(self, config: SafetyConfig):
+    def __init__(self, config: SafetyConfigView):
         """
         Initialize input validator.
 
@@ -39,22 +174,47 @@ class InputValidator:
         """
         self.config = config
 
-        # Prompt injection patterns
+        # The limit is fixed for the validator's lifetime: bind it once
+        # here so the per-request path reads one slot instead of going
+        # through the config view on every call
+        self._max_prompt_length = config.max_prompt_length
+
+        # Prompt injection patterns. Word-boundary anchors let the engine
+        # discard candidate positions mid-word (no backtracking into
+        # "preignore" or "rulesets"), and \s+ between words catches
+        # injections padded with tabs or doubled spaces that the literal
+        # single-space forms missed.
         self.injection_patterns = [
-            r"ignore (previous|above|all|any) (instructions?|prompts?|rules?)",
-            r"disregard (all|any|the) (previous|prior|above) (instructions?|prompts?)",
-            r"(new|updated) (instruction|prompt|task|rule)s?:",
-            r"system:?\s*(you are|act as|pretend|simulate)",
+            r"\bignore\s+(?:previous|above|all|any)\s+(?:instructions?|prompts?|rules?)\b",
+            r"\bdisregard\s+(?:all|any|the)\s+(?:previous|prior|above)\s+(?:instructions?|prompts?)\b",
+            r"\b(?:new|updated)\s+(?:instruction|prompt|task|rule)s?:",
+            r"\bsystem:?\s*(?:you\s+are|act\s+as|pretend|simulate)\b",
             r"<\|im_start\|>|<\|im_end\|>",  # Chat format markers
             r"\[INST\]|\[/INST\]",  # Instruction markers
-            r"forget (everything|all|your) (previous|above)",
-            r"override (all|previous|safety) (instructions?|settings?|rules?)",
+            r"\bforget\s+(?:everything|all|your)\s+(?:previous|above)\b",
+            r"\boverride\s+(?:all|previous|safety)\s+(?:instructions?|settings?|rules?)\b",
         ]
 
-    async def validate_input(self, context: RequestContext) -> ValidationResult:
+        # Fused into one alternation so detection is a single pass over
+        # the prompt instead of one scan per pattern; the check is purely
+        # boolean, so no per-pattern attribution is needed after a hit.
+        # The engine comes from the shared registry, so constructing
+        # another validator with the same patterns compiles nothing.
+        self._injection_combined = _injection_engine(tuple(self.injection_patterns))
+
+        # Verdict memo for short prompts: gateways see the same prompts
+        # repeatedly (retries, probes, templates), and the patterns are
+        # fixed per validator so the verdict never changes
+        self._injection_memo: dict = {}
+
+    def validate_input(self, context: RequestContext) -> ValidationResult:
         """
         Validate input request comprehensively.
 
+        Synchronous: every check is pure CPU work, so going through a
+        coroutine added per-request frame and scheduling overhead for
+        nothing.
+
         Args:
             context: Request context
 
@@ -65,53 +225,116 @@ class InputValidator:
             ValidationError: If validation fails critically
             PromptInjectionError: If prompt injection detected
         """
-        result = ValidationResult(is_valid=True, errors=[], warnings=[])
+        return self._validate(context, check_injection=True)
+
+    def validate_batch(self, contexts: List[RequestContext]) -> List[ValidationResult]:
+        """
+        Validate several requests, amortizing the injection scan.
+
+        One fused scan over the NUL-joined prompts decides injection for
+        the whole batch: no pattern can match across the separator (none
+        matches NUL), so a clean joined scan proves every prompt clean
+        and the per-request scans are skipped entirely.
+
+        Args:
+            contexts: Request contexts to validate
+
+        Returns:
+            ValidationResult per context, in order
+
+        Raises:
+            ValidationError: If any context fails validation critically
+            PromptInjectionError: If prompt injection detected
+        """
+        if not contexts:
+            return []
+
+        joined = "\x00".join(context.prompt for context in contexts)
+        batch_clean = not (
+            len(joined) >= _MIN_INJECTION_LEN and self._check_injection(joined)
+        )
+
+        return [
+            self._validate(context, check_injection=not batch_clean)
+            for context in contexts
+        ]
+
+    def _validate(
+        self, context: RequestContext, check_injection: bool
+    ) -> ValidationResult:
+        """
+        Run the validation checks for one request.
+
+        Args:
+            context: Request context
+            check_injection: Run the per-prompt injection scan; False when
+                a batch-level scan already proved the prompt clean
+
+        Returns:
+            ValidationResult with validation status
+
+        Raises:
+            ValidationError: If validation fails critically
+            PromptInjectionError: If prompt injection detected
+        """
+        # Failures and warnings accumulate in locals; a ValidationResult
+        # is only built when there is something to report, and the clean
+        # path returns the shared _OK_RESULT without allocating
+        errors: List[str] = []
+        warnings: List[str] = []
 
         # 1. Schema validation (already done by Pydantic at construction)
         # If we got here, schema is valid
 
-        # 2. Prompt injection detection
-        injection_detected = self._check_injection(context.prompt)
-        if injection_detected:
-            result.is_valid = False
-            result.errors.append("Potential prompt injection detected")
-            result.severity = "high"
-            raise PromptInjectionError(
-                "Prompt injection attempt detected",
-                details={"prompt_preview": context.prompt[:200]},
+        # 2. Content length validation first: an oversized prompt is
+        # rejected in O(1) instead of being regex-scanned end to end
+        prompt = context.prompt
+        if len(prompt) > self._max_prompt_length:
+            errors.append(
+                f"Prompt exceeds maximum length: {len(prompt)} > {self._max_prompt_length}"
+            )
+            raise ValidationError(
+                f"Input validation failed: {', '.join(errors)}",
+                details={"errors": errors, "warnings": warnings, "severity": "low"},
             )
 
-        # 3. Content length validation
-        if len(context.prompt) > self.config.max_prompt_length:
-            result.is_valid = False
-            result.errors.append(
-                f"Prompt exceeds maximum length: {len(context.prompt)} > {self.config.max_prompt_length}"
+        # 3. Prompt injection detection (nothing shorter than the
+        # shortest pattern literal can match)
+        if (
+            check_injection
+            and len(prompt) >= _MIN_INJECTION_LEN
+            and self._check_injection(prompt)
+        ):
+            raise PromptInjectionError(
+                "Prompt injection attempt detected",
+                details={"prompt_preview": prompt[:200]},
             )
 
-        # 4. Forbidden pattern checking
+        # 4. Forbidden pattern checking: one combined-regex pass on the
+        # clean path; identify the offending patterns only after a hit
         if context.forbidden_patterns:
-            for pattern in context.forbidden_patterns:
-                if re.search(pattern, context.prompt, re.IGNORECASE):
-                    result.is_valid = False
-                    result.errors.append(f"Forbidden pattern detected: {pattern}")
+            combined = _compile_forbidden(tuple(context.forbidden_patterns))
+            if combined.search(prompt):
+                for pattern in context.forbidden_patterns:
+                    if _compile_ci(pattern).search(prompt):
+                        errors.append(f"Forbidden pattern detected: {pattern}")
 
         # 5. Topic allowlist validation
         if context.allowed_topics:
-            if not self._check_topics(context.prompt, context.allowed_topics):
-                result.warnings.append("Prompt topic may not be in allowlist")
+            if not self._check_topics(prompt, context.allowed_topics):
+                warnings.append("Prompt topic may not be in allowlist")
 
         # Raise if validation failed
-        if not result.is_valid:
+        if errors:
             raise ValidationError(
-                f"Input validation failed: {', '.join(result.errors)}",
-                details={
-                    "errors": result.errors,
-                    "warnings": result.warnings,
-                    "severity": result.severity,
-                },
+                f"Input validation failed: {', '.join(errors)}",
+                details={"errors": errors, "warnings": warnings, "severity": "low"},
             )
 
-        return result
+        if warnings:
+            return ValidationResult(is_valid=True, errors=[], warnings=warnings)
+
+        return _OK_RESULT
 
     def _check_injection(self, prompt: str) -> bool:
         """
@@ -123,10 +346,26 @@ class InputValidator:
         Returns:
             True if injection pattern detected
         """
-        for pattern in self.injection_patterns:
-            if re.search(pattern, prompt, re.IGNORECASE):
-                return True
-        return False
+        memoize = len(prompt) <= _MEMO_MAX_PROMPT_LEN
+        if memoize:
+            cached = self._injection_memo.get(prompt)
+            if cached is not None:
+                return cached
+
+        # The lowercased copy plus a handful of str.__contains__ scans is
+        # far cheaper than one NFA pass, and on benign prompts (the
+        # common case) it is the only work done
+        prompt_lower = prompt.lower()
+        if not any(atom in prompt_lower for atom in _INJECTION_ATOMS):
+            verdict = False
+        else:
+            verdict = self._injection_combined.search(prompt) is not None
+
+        if memoize:
+            if len(self._injection_memo) >= 8192:
+                self._injection_memo.clear()
+            self._injection_memo[prompt] = verdict
+        return verdict
 
     def _check_topics(self, prompt: str, allowed_topics: List[str]) -> bool:
         """
@@ -139,9 +378,8 @@ class InputValidator:
         Returns:
             True if prompt matches allowed topics
         """
-        # Simple keyword matching
-        prompt_lower = prompt.lower()
-        return any(topic.lower() in prompt_lower for topic in allowed_topics)
+        # Simple keyword matching, fused into a single scan
+        return _compile_topics(tuple(allowed_topics)).search(prompt) is not None
 
 
 class OutputValidator:
@@ -155,7 +393,7 @@ class OutputValidator:
     - Response completeness
     """
 
-    def __init__(self, config: SafetyConfig):
+    def __init__(self, config: SafetyConfigView):
         """
         Initialize output validator.
 
@@ -164,10 +402,13 @@ class OutputValidator:
         """
         self.config = config
 
-    async def validate_output(self, response: LLMResponse) -> ValidationResult:
+    def validate_output(self, response: LLMResponse) -> ValidationResult:
         """
         Validate output response.
 
+        Synchronous for the same reason as validate_input: the checks
+        never block.
+
         Args:
             response: LLM response
 
@@ -177,40 +418,51 @@ class OutputValidator:
         Raises:
             ValidationError: If validation fails critically
         """
-        result = ValidationResult(is_valid=True, errors=[], warnings=[])
+        # Snapshot the fields once: each read below is otherwise a
+        # Pydantic model attribute lookup, and most checks touch them
+        # more than once
+        quality_score = response.quality_score
+        text = response.response_text
+
+        errors: List[str] = []
+        warnings: List[str] = []
+        severity = "low"
 
         # 1. Check for harmful content (critical)
         if response.contains_harmful_content:
-            result.is_valid = False
-            result.errors.append("Response contains harmful content")
-            result.severity = "critical"
+            errors.append("Response contains harmful content")
+            severity = "critical"
 
         # 2. Check quality thresholds
-        if response.quality_score < 0.5:
-            result.is_valid = False
-            result.errors.append(
-                f"Response quality too low: {response.quality_score:.2f} < 0.5"
-            )
-            result.severity = "high"
+        if quality_score < 0.5:
+            errors.append(f"Response quality too low: {quality_score:.2f} < 0.5")
+            severity = "high"
 
         # 3. Check for hallucinations
         if response.is_hallucination:
-            result.is_valid = False
-            result.errors.append("Response likely contains hallucination")
-            result.severity = "high"
+            errors.append("Response likely contains hallucination")
+            severity = "high"
 
         # 4. Check for off-task responses
         if response.is_off_task:
-            result.warnings.append("Response may be off-task or irrelevant")
+            warnings.append("Response may be off-task or irrelevant")
 
         # 5. Length validation
-        if len(response.response_text) == 0:
-            result.is_valid = False
-            result.errors.append("Empty response")
-            result.severity = "high"
+        if not text:
+            errors.append("Empty response")
+            severity = "high"
 
         # 6. Check for incomplete responses
-        if len(response.response_text) < 10:
-            result.warnings.append("Response is very short, may be incomplete")
+        if len(text) < 10:
+            warnings.append("Response is very short, may be incomplete")
+
+        if errors or warnings:
+            return ValidationResult(
+                is_valid=not errors,
+                errors=errors,
+                warnings=warnings,
+                severity=severity,
+            )
 
-        return result
+        # Clean responses share the one immutable success result
+        return _OK_RESULT
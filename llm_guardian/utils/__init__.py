@@ -1,3 +1,17 @@
 """Utility functions and helpers."""
 
-__all__ = []
+from llm_guardian.utils.queues import collect_batch
+from llm_guardian.utils.serialization import (
+    context_dump,
+    dump_jsonable,
+    dumps_bytes,
+    to_json_bytes,
+)
+
+__all__ = [
+    "collect_batch",
+    "context_dump",
+    "dump_jsonable",
+    "dumps_bytes",
+    "to_json_bytes",
+]
@@ -0,0 +1,91 @@
+"""
+Cancellation-safe batch collection from asyncio queues.
+
+The batched writers (audit log, checkpoint flusher, request coalescer)
+all drain a queue into a batch bounded by a size cap and a time window.
+Implementing the window with ``asyncio.wait_for(queue.get(), ...)`` is
+subtly broken on Python 3.10/3.11: when the inner get completes in the
+same event-loop tick that the surrounding task is cancelled, the legacy
+``wait_for`` swallows the cancellation and returns the item instead
+(bpo-37658). A ``while True`` writer then re-parks on its queue, the
+gather over cancelled tasks in ``asyncio.run`` teardown never finishes,
+and the process hangs until SIGKILL.
+
+``collect_batch`` collects with ``asyncio.wait`` instead, which never
+consumes a cancellation, and salvages an item the getter already
+dequeued in the cancelling tick so the caller can flush it before
+exiting.
+"""
+
+import asyncio
+from typing import Any, List, Optional
+
+
+async def collect_batch(
+    queue: "asyncio.Queue",
+    batch: List[Any],
+    max_items: int,
+    window: float,
+    stop: Optional[object] = None,
+) -> bool:
+    """
+    Drain `queue` into `batch` until it holds max_items or window elapses.
+
+    Args:
+        queue: Source queue
+        batch: Batch to append to, usually seeded with a first item
+        max_items: Size cap, counting items already in `batch`
+        window: Seconds to wait for the batch to fill
+        stop: Optional sentinel; when dequeued it is not appended and
+            collection reports a requested stop
+
+    Returns:
+        True if the stop sentinel was dequeued, else False
+
+    Raises:
+        asyncio.CancelledError: When the surrounding task is cancelled.
+            An item the getter dequeued in the cancelling tick is
+            salvaged into `batch` first, so the caller can flush the
+            batch before unwinding.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + window
+
+    while len(batch) < max_items:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return False
+
+        getter = loop.create_task(queue.get())
+        try:
+            done, _ = await asyncio.wait((getter,), timeout=remaining)
+        except asyncio.CancelledError:
+            # A getter still waiting is cancelled before it can consume
+            # anything (Queue.get re-wakes the next waiter and leaves the
+            # item queued); one that already ran holds an item — keep it
+            if getter.done() and not getter.cancelled():
+                item = getter.result()
+                if item is not stop:
+                    batch.append(item)
+            else:
+                getter.cancel()
+            raise
+
+        if not done:
+            # Window elapsed. A put landing in this same tick may have
+            # completed the getter before the cancel takes effect, so
+            # keep anything it dequeued.
+            getter.cancel()
+            if getter.done() and not getter.cancelled():
+                item = getter.result()
+                if item is stop:
+                    return True
+                batch.append(item)
+            return False
+
+        item = getter.result()
+        if item is stop:
+            return True
+        batch.append(item)
+
+    return False
@@ -0,0 +1,111 @@
+"""
+Fast serialization helpers for hot-path Pydantic models.
+
+Uses orjson when available (3-10x faster than stdlib json for these
+payloads) and falls back to the standard library otherwise. Also caches
+the dumped form of RequestContext, which is serialized multiple times per
+request (audit logging plus checkpointing).
+"""
+
+import json
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict
+
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+    HAS_ORJSON = False
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize types the encoders do not handle natively."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+def dumps_bytes(data: Any) -> bytes:
+    """
+    Serialize arbitrary data to JSON bytes.
+
+    Args:
+        data: JSON-compatible data
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(data, default=_json_default)
+    return json.dumps(data, default=_json_default).encode("utf-8")
+
+
+def to_json_bytes(model: BaseModel) -> bytes:
+    """
+    Serialize a Pydantic model to JSON bytes.
+
+    Args:
+        model: Model to serialize
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(model.model_dump(mode="json"), default=_json_default)
+    return model.model_dump_json().encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def _adapter(tp: type) -> TypeAdapter:
+    """One TypeAdapter (and thus one prebuilt serializer) per type."""
+    return TypeAdapter(tp)
+
+
+def dump_jsonable(obj: Any) -> Dict[str, Any]:
+    """
+    Dump a dataclass instance to a JSON-compatible dict.
+
+    BaseModel subclasses already cache a serializer per class, but the
+    slotted dataclasses used on internal paths would otherwise rebuild a
+    core schema on every `TypeAdapter(...)` call (or fall back to the
+    recursive `dataclasses.asdict`). The adapter is cached per type so
+    repeated dumps reuse one prebuilt serializer.
+
+    Args:
+        obj: Dataclass (or other TypeAdapter-supported) instance
+
+    Returns:
+        JSON-compatible dict representation
+    """
+    return _adapter(type(obj)).dump_python(obj, mode="json")
+
+
+def context_dump(context: BaseModel) -> Dict[str, Any]:
+    """
+    Get the JSON-mode dump of a RequestContext, cached per instance.
+
+    A single request dumps its context for the audit log and for each
+    checkpoint write; caching avoids repeating the Pydantic serializer
+    walk for an immutable-in-practice payload.
+
+    Args:
+        context: RequestContext (or any model with a `_dump_cache` slot)
+
+    Returns:
+        JSON-compatible dict representation
+    """
+    cached = getattr(context, "_dump_cache", None)
+    if cached is not None:
+        return cached
+
+    dumped = context.model_dump(mode="json")
+    try:
+        object.__setattr__(context, "_dump_cache", dumped)
+    except (AttributeError, ValueError):
+        pass
+    return dumped
@@ -0,0 +1,93 @@
+"""
+Regression tests for event-loop teardown with batched background writers.
+
+On Python 3.10/3.11 the legacy asyncio.wait_for could swallow a task
+cancellation when its inner queue.get completed in the same tick
+(bpo-37658); a batched writer built on it survived asyncio.run teardown
+and hung the process whenever a request failed without an explicit
+aclose(). These tests run that scenario in a subprocess and assert the
+process actually dies with the original error.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+
+
+def _run_script(script: str) -> subprocess.CompletedProcess:
+    """Run a scenario in a subprocess; a hang fails via the timeout."""
+    return subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        timeout=10,
+        cwd=_REPO_ROOT,
+    )
+
+
+def test_failing_request_without_aclose_tears_down(tmp_path):
+    """An audit record logged in the teardown tick must not hang the loop."""
+    script = f"""
+import asyncio
+from pathlib import Path
+from llm_guardian.recovery.audit_logger import AuditLogger
+
+async def main():
+    logger = AuditLogger(Path({str(tmp_path)!r}))
+    logger._log_event("request", {{"request_id": "r0"}})
+    await asyncio.sleep(0.01)  # writer parks in its collection window
+    logger._log_event("error", {{"request_id": "r1"}})  # same tick as teardown
+    raise RuntimeError("provider outage")
+
+asyncio.run(main())
+"""
+    proc = _run_script(script)
+
+    assert proc.returncode == 1, proc.stderr
+    assert "provider outage" in proc.stderr
+
+    # Both records survive: the batched one is flushed on cancellation,
+    # the queued one by the atexit flush
+    lines = []
+    for log_file in tmp_path.glob("*.jsonl"):
+        lines.extend(
+            json.loads(line) for line in log_file.read_bytes().splitlines() if line
+        )
+    assert sorted(entry["request_id"] for entry in lines) == ["r0", "r1"]
+
+
+def test_checkpoint_write_during_teardown_tears_down(tmp_path):
+    """A checkpoint enqueued in the teardown tick must not hang the loop."""
+    script = f"""
+import asyncio
+from datetime import datetime
+from pathlib import Path
+from llm_guardian.core.models import RequestContext
+from llm_guardian.recovery.state_manager import StateManager
+
+def ctx():
+    return RequestContext.model_construct(
+        request_id="rq", user_id="u", session_id="s", prompt="p",
+        model="m", max_tokens=5, temperature=0.1,
+        timestamp=datetime.utcnow(), metadata={{}}, priority="normal",
+        forbidden_patterns=[], allowed_topics=[],
+    )
+
+async def main():
+    manager = StateManager(Path({str(tmp_path)!r}), flush_interval=0.05)
+    save = asyncio.ensure_future(manager.save_checkpoint("rq", ctx(), {{}}))
+    await asyncio.sleep(0.01)  # flusher parks in its collection window
+    save2 = asyncio.ensure_future(manager.save_checkpoint("rq2", ctx(), {{}}))
+    raise RuntimeError("provider outage")
+
+asyncio.run(main())
+"""
+    proc = _run_script(script)
+
+    assert proc.returncode == 1, proc.stderr
+    assert "provider outage" in proc.stderr
+    # The batched write was flushed before the flusher unwound
+    assert any(f.name.startswith("rq") for f in tmp_path.iterdir())